@@ -56,6 +56,40 @@ class Process(ContainerOrdered):
             results[tag] = result
          
         return results
+    
+    def flatten(self):
+        """This collects the steps of the process and all of its sub-processes, in execution order,
+            into a flat tuple of callables. Calling each in turn is equivalent to evaluating the process,
+            without walking the nested containers on every call.
+        
+                Assumptions:
+                The process is not modified while the flattened steps are in use
+        
+                Source:
+                N/A
+        
+                Inputs:
+                None
+        
+                Outputs:
+                steps  - callables of the process [tuple]
+        
+                Properties Used:
+                N/A
+            """ 
+        
+        steps = []
+        
+        for step in self.values():
+            
+            if isinstance(step,Process):
+                steps.extend(step.flatten())
+            elif hasattr(step,'evaluate'): 
+                steps.append(step.evaluate)
+            else:
+                steps.append(step)
+                
+        return tuple(steps)
         
     def __call__(self,*args,**kwarg):
         """This is used to set the class' call behavior to the evaluate functions.
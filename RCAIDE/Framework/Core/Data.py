@@ -27,6 +27,9 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
 dictgetitem = dict.__getitem__
 objgetattrib = object.__getattribute__
 
+# ancestor classes of each Data subclass as returned by get_bases, filled in on first construction
+_bases_cache = {}
+
 # ----------------------------------------------------------------------
 #   Data
 # ----------------------------------------------------------------------        
@@ -135,8 +138,11 @@ class Data(dict):
         self = super(Data,cls).__new__(cls)
         super(Data,self).__init__() 
         
-        # get base class list
-        klasses = self.get_bases()
+        # get base class list, the ancestor tree of a class never changes so it is only found once per class
+        try:
+            klasses = _bases_cache[cls]
+        except KeyError:
+            klasses = _bases_cache[cls] = self.get_bases()
                 
         # fill in defaults trunk to leaf
         for klass in klasses[::-1]:
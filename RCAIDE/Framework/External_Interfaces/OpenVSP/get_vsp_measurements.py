@@ -19,6 +19,7 @@ except ImportError:
         # This allows RCAIDE to build without OpenVSP
         pass
 import numpy as np
+from collections import defaultdict
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Get VSP Measurements
@@ -66,24 +67,23 @@ def get_vsp_measurements(filename = 'Unnamed_CompGeom.csv', measurement_type = '
     vsp.SetComputationFileName(file_type, filename)
     vsp.ComputeCompGeom(vsp.SET_ALL, half_mesh, file_type)
     
-    f = open(filename)
+    measurements = defaultdict(float)
     
-    measurements = dict()
+    # Read the component rows, which end at the first blank line
+    lines = []
+    with open(filename) as f:
+        next(f) # header
+        for line in f:
+            if line == '\n':
+                break
+            lines.append(line)
+    if len(lines) == 0:
+        return dict(measurements)
     
     # Extract wetted areas for each component
-    for ii, line in enumerate(f):
-        if ii == 0:
-            pass
-        elif line == '\n':
-            break
-        else:
-            vals = line.split(',')
-            item_tag = vals[0][:]
-            item_w_area = float(vals[output_ind])
-            if item_tag in measurements:
-                item_w_area = measurements[item_tag] + item_w_area
-            measurements[item_tag] = item_w_area
-            
-    f.close()
+    item_tags   = [line.split(',',1)[0] for line in lines]
+    item_values = np.loadtxt(lines,delimiter=',',usecols=output_ind,ndmin=1).tolist()
+    for item_tag, item_w_area in zip(item_tags,item_values):
+        measurements[item_tag] += item_w_area
     
-    return measurements
\ No newline at end of file
+    return dict(measurements)
\ No newline at end of file
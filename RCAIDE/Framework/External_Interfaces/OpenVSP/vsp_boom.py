@@ -20,6 +20,9 @@ except ImportError:
     except ImportError:
         # This allows RCAIDE to build without OpenVSP
         pass
+
+# names of the OpenVSP XSec shape types, indexed by shape enumeration
+_xsec_shape_names = ('point','circle','ellipse','super ellipse','rounded rectangle','general fuse','fuse file')
     
 # ---------------------------------------------------------------------------------------------------------------------- 
 #  vsp read boom
@@ -108,32 +111,38 @@ def read_vsp_boom(b_id,fux_idx,sym_flag, units_type='SI', fineness=True, use_sca
     boom.origin[0][2] = vsp.GetParmVal(b_id, 'Z_Location', 'XForm') * units_factor
 
     boom.lengths.total         = vsp.GetParmVal(b_id, 'Length', 'Design') * units_factor
-    boom.vsp_data.xsec_surf_id = vsp.GetXSecSurf(b_id, 0) 			        # There is only one XSecSurf in geom.
-    boom.vsp_data.xsec_num     = vsp.GetNumXSec(boom.vsp_data.xsec_surf_id) 		# Number of xsecs in boom.	 
+    xsec_surf                  = vsp.GetXSecSurf(b_id, 0) 			        # There is only one XSecSurf in geom.
+    n_xsec                     = vsp.GetNumXSec(xsec_surf) 		        # Number of xsecs in boom.	 
+    boom.vsp_data.xsec_surf_id = xsec_surf
+    boom.vsp_data.xsec_num     = n_xsec
 
         
     x_locs    = []
     heights   = []
     widths    = []
     eff_diams = []
-    lengths   = []
 
     # -----------------
     # Boom segments
     # -----------------
+    
+    # Section x locations are read once; segment lengths follow from their differences.
+    xsec_ids         = [vsp.GetXSec(xsec_surf, ii) for ii in range(n_xsec)] # VSP XSec IDs.
+    x_percents       = np.array([vsp.GetParmVal(vsp.GetXSecParm(x_sec, 'XLocPercent')) for x_sec in xsec_ids])
+    seg_lengths      = np.zeros(n_xsec) # Segment length: stored as length since previous segment. (last segment will have length 0.0.)
+    seg_lengths[:-1] = boom.lengths.total*np.diff(x_percents) * units_factor
 
-    for ii in range(0, boom.vsp_data.xsec_num): 
+    for ii in range(0, n_xsec): 
         # Create the segment
-        x_sec                     = vsp.GetXSec(boom.vsp_data.xsec_surf_id, ii) # VSP XSec ID.
+        x_sec                     = xsec_ids[ii]
         segment                   = RCAIDE.Library.Components.Booms.Segment()
         segment.vsp_data.xsec_id  = x_sec 
         segment.tag               = 'segment_' + str(ii)
 
         # Pull out Parms that will be needed
-        X_Loc_P = vsp.GetXSecParm(x_sec, 'XLocPercent')
         Z_Loc_P = vsp.GetXSecParm(x_sec, 'ZLocPercent')
 
-        segment.percent_x_location = vsp.GetParmVal(X_Loc_P) # Along boom length.
+        segment.percent_x_location = float(x_percents[ii]) # Along boom length.
         segment.percent_z_location = vsp.GetParmVal(Z_Loc_P ) # Vertical deviation of boom center.
         segment.height             = vsp.GetXSecHeight(segment.vsp_data.xsec_id) * units_factor
         segment.width              = vsp.GetXSecWidth(segment.vsp_data.xsec_id) * units_factor
@@ -144,24 +153,18 @@ def read_vsp_boom(b_id,fux_idx,sym_flag, units_type='SI', fineness=True, use_sca
         widths.append(segment.width)
         eff_diams.append(segment.effective_diameter)
 
-        if ii != (boom.vsp_data.xsec_num-1): # Segment length: stored as length since previous segment. (last segment will have length 0.0.)
-            next_xsec = vsp.GetXSec(boom.vsp_data.xsec_surf_id, ii+1)
-            X_Loc_P_p = vsp.GetXSecParm(next_xsec, 'XLocPercent')
-            percent_x_loc_p1 = vsp.GetParmVal(X_Loc_P_p) 
-            segment.length = boom.lengths.total*(percent_x_loc_p1 - segment.percent_x_location) * units_factor
-        else:
-            segment.length = 0.0
-        lengths.append(segment.length)
+        segment.length = float(seg_lengths[ii])
 
         shape	   = vsp.GetXSecShape(segment.vsp_data.xsec_id)
-        shape_dict = {0:'point',1:'circle',2:'ellipse',3:'super ellipse',4:'rounded rectangle',5:'general fuse',6:'fuse file'}
-        segment.vsp_data.shape = shape_dict[shape]	
+        segment.vsp_data.shape = _xsec_shape_names[shape]	
 
         boom.segments.append(segment)
 
-    boom.heights.at_quarter_length          = get_boom_height(boom, .25)  # Calls get_boom_height function (below).
-    boom.heights.at_three_quarters_length   = get_boom_height(boom, .75) 
-    boom.heights.at_wing_root_quarter_chord = get_boom_height(boom, .4) 
+    # Heights at fixed stations, linearly interpolated between segments in a single call (as in get_boom_height below).
+    h_quarter, h_three_quarters, h_wing_root = np.interp([.25, .75, .4], x_locs, heights)
+    boom.heights.at_quarter_length          = h_quarter 
+    boom.heights.at_three_quarters_length   = h_three_quarters 
+    boom.heights.at_wing_root_quarter_chord = h_wing_root 
 
     boom.heights.maximum    = max(heights)          # Max segment height.	
     boom.width              = max(widths)           # Max segment width.
@@ -169,8 +172,8 @@ def read_vsp_boom(b_id,fux_idx,sym_flag, units_type='SI', fineness=True, use_sca
 
     boom.areas.front_projected  = np.pi*((boom.effective_diameter)/2)**2
 
-    eff_diam_gradients_fwd = np.array(eff_diams[1:]) - np.array(eff_diams[:-1])		# Compute gradients of segment effective diameters.
-    eff_diam_gradients_fwd = np.multiply(eff_diam_gradients_fwd, lengths[:-1])
+    eff_diam_gradients_fwd  = np.diff(eff_diams)		# Compute gradients of segment effective diameters.
+    eff_diam_gradients_fwd *= seg_lengths[:-1]
 
     boom = compute_boom_fineness(boom, x_locs, eff_diams, eff_diam_gradients_fwd)	
 
@@ -210,7 +213,6 @@ def write_vsp_boom(boom,area_tags, OML_set_ind):
         nose.z_pos                            [-] z position of the nose as a percentage of boom length (.1 is 10%)
         tail.top.angle                        [degrees]
         tail.top.strength                     [-]
-        tail.z_pos (optional, 0.02 default)   [-] z position of the tail as a percentage of boom length (.1 is 10%)
       Segments. (optional)
         width                                 [m]
         height                                [m]
@@ -237,25 +239,22 @@ def write_vsp_boom(boom,area_tags, OML_set_ind):
     fuse_y_rotation    = boom.y_rotation
     fuse_z_rotation    = boom.z_rotation
     
-    widths  = []
-    heights = []
-    x_poses = []
-    z_poses = []
-    segs = boom.segments
-    for seg in segs:
-        widths.append(seg.width)
-        heights.append(seg.height)
-        x_poses.append(seg.percent_x_location)
-        z_poses.append(seg.percent_z_location)
+    segs    = boom.segments.values()
+    widths  = np.array([seg.width for seg in segs])
+    heights = np.array([seg.height for seg in segs])
+    x_poses = np.array([seg.percent_x_location for seg in segs])
+    z_poses = np.array([seg.percent_z_location for seg in segs])
 
     end_ind = num_segs-1
+    
+    # section parm group names, including the point added when closing the tail
+    xsec_names  = ['XSec_'+str(k) for k in range(num_segs+1)]
+    curve_names = ['XSecCurve_'+str(k) for k in range(num_segs+1)]
 
     b_id = vsp.AddGeom("BOOM") 
     vsp.SetGeomName(b_id, boom.tag)
     area_tags[boom.tag] = ['booms',boom.tag]
 
-    tail_z_pos = 0.02 # default value
-
     # set boom relative location and rotation
     vsp.SetParmVal( b_id,'X_Rel_Rotation','XForm',fuse_x_rotation)
     vsp.SetParmVal( b_id,'Y_Rel_Rotation','XForm',fuse_y_rotation)
@@ -282,22 +281,15 @@ def write_vsp_boom(boom,area_tags, OML_set_ind):
         if not vals.nose.TB_Sym:
             vsp.SetParmVal(b_id,"BottomLAngle","XSec_0",vals.nose.bottom.angle)
             vsp.SetParmVal(b_id,"BottomLStrength","XSec_0",vals.nose.bottom.strength)           
- 
-        if 'z_pos' in vals.tail:
-            tail_z_pos = vals.tail.z_pos
-        else:
-            pass # use above default
 
- 
-    # OpenVSP vals do not exist:
-    vals                   = Data()
-    vals.nose              = Data()
-    vals.tail              = Data()
-    vals.tail.top          = Data()
+    else:
+        # OpenVSP vals do not exist:
+        vals                   = Data()
+        vals.tail              = Data()
+        vals.tail.top          = Data()
 
-    vals.nose.z_pos        = 0.0
-    vals.tail.top.angle    = 0.0
-    vals.tail.top.strength = 0.0
+        vals.tail.top.angle    = 0.0
+        vals.tail.top.strength = 0.0
 
     #if len(np.unique(x_poses)) != len(x_poses):
         #raise ValueError('Duplicate boom section positions detected.')
@@ -308,73 +300,69 @@ def write_vsp_boom(boom,area_tags, OML_set_ind):
         vsp.CutXSec(b_id,1) # remove extra default section
         for i in range(num_segs-2): # add back the required number of sections
             vsp.InsertXSec(b_id, 0, vsp.XS_ELLIPSE)           
-            vsp.Update()
+        vsp.Update() # one regeneration once all sections are inserted
     for i in range(num_segs-2):
         # Bunch sections to allow proper length settings in the next step
         # This is necessary because OpenVSP will not move a section past an adjacent section
-        vsp.SetParmVal(b_id, "XLocPercent", "XSec_"+str(i+1),1e-6*(i+1))
+        vsp.SetParmVal(b_id, "XLocPercent", xsec_names[i+1],1e-6*(i+1))
         vsp.Update()
     if x_poses[1] < (num_segs-2)*1e-6:
         print('Warning: Second boom section is too close to the nose. OpenVSP model may not be accurate.')
+    top_angles, bot_angles, side_angles = compute_section_angles(x_poses, z_poses, heights, widths, length)
     for i in reversed(range(num_segs-2)):
         # order is reversed because sections are initially bunched in the front and cannot be extended passed the next
-        vsp.SetParmVal(b_id, "XLocPercent", "XSec_"+str(i+1),x_poses[i+1])
-        vsp.SetParmVal(b_id, "ZLocPercent", "XSec_"+str(i+1),z_poses[i+1])
-        vsp.SetParmVal(b_id, "Ellipse_Width", "XSecCurve_"+str(i+1), widths[i+1])
-        vsp.SetParmVal(b_id, "Ellipse_Height", "XSecCurve_"+str(i+1), heights[i+1])   
+        vsp.SetParmVal(b_id, "XLocPercent", xsec_names[i+1],x_poses[i+1])
+        vsp.SetParmVal(b_id, "ZLocPercent", xsec_names[i+1],z_poses[i+1])
+        vsp.SetParmVal(b_id, "Ellipse_Width", curve_names[i+1], widths[i+1])
+        vsp.SetParmVal(b_id, "Ellipse_Height", curve_names[i+1], heights[i+1])   
         vsp.Update()             
-        set_section_angles(i, vals.nose.z_pos, tail_z_pos, x_poses, z_poses, heights, widths,length,end_ind,b_id)            
+        set_section_angles(i, top_angles[i], bot_angles[i], side_angles[i], b_id)            
 
-    vsp.SetParmVal(b_id, "XLocPercent", "XSec_"+str(0),x_poses[0])
-    vsp.SetParmVal(b_id, "ZLocPercent", "XSec_"+str(0),z_poses[0])
-    vsp.SetParmVal(b_id, "XLocPercent", "XSec_"+str(end_ind),x_poses[-1])
-    vsp.SetParmVal(b_id, "ZLocPercent", "XSec_"+str(end_ind),z_poses[-1])    
+    vsp.SetParmVal(b_id, "XLocPercent", xsec_names[0],x_poses[0])
+    vsp.SetParmVal(b_id, "ZLocPercent", xsec_names[0],z_poses[0])
+    vsp.SetParmVal(b_id, "XLocPercent", xsec_names[end_ind],x_poses[-1])
+    vsp.SetParmVal(b_id, "ZLocPercent", xsec_names[end_ind],z_poses[-1])    
 
     # Tail
     if heights[-1] > 0.: 
         pos = len(heights)-1
         vsp.InsertXSec(b_id, pos-1, vsp.XS_ELLIPSE)
         vsp.Update()
-        vsp.SetParmVal(b_id, "Ellipse_Width", "XSecCurve_"+str(pos), widths[-1])
-        vsp.SetParmVal(b_id, "Ellipse_Height", "XSecCurve_"+str(pos), heights[-1])
-        vsp.SetParmVal(b_id, "XLocPercent", "XSec_"+str(pos),x_poses[-1])
-        vsp.SetParmVal(b_id, "ZLocPercent", "XSec_"+str(pos),z_poses[-1])              
+        vsp.SetParmVal(b_id, "Ellipse_Width", curve_names[pos], widths[-1])
+        vsp.SetParmVal(b_id, "Ellipse_Height", curve_names[pos], heights[-1])
+        vsp.SetParmVal(b_id, "XLocPercent", xsec_names[pos],x_poses[-1])
+        vsp.SetParmVal(b_id, "ZLocPercent", xsec_names[pos],z_poses[-1])              
 
         xsecsurf = vsp.GetXSecSurf(b_id,0)
         vsp.ChangeXSecShape(xsecsurf,pos+1,vsp.XS_POINT)
         vsp.Update()           
-        vsp.SetParmVal(b_id, "XLocPercent", "XSec_"+str(pos+1),x_poses[-1])
-        vsp.SetParmVal(b_id, "ZLocPercent", "XSec_"+str(pos+1),z_poses[-1])     
+        vsp.SetParmVal(b_id, "XLocPercent", xsec_names[pos+1],x_poses[-1])
+        vsp.SetParmVal(b_id, "ZLocPercent", xsec_names[pos+1],z_poses[-1])     
 
         # update strengths to make end flat
-        vsp.SetParmVal(b_id,"TopRStrength","XSec_"+str(pos), 0.)
-        vsp.SetParmVal(b_id,"RightRStrength","XSec_"+str(pos), 0.)
-        vsp.SetParmVal(b_id,"BottomRStrength","XSec_"+str(pos), 0.)
-        vsp.SetParmVal(b_id,"TopLStrength","XSec_"+str(pos+1), 0.)
-        vsp.SetParmVal(b_id,"RightLStrength","XSec_"+str(pos+1), 0.)            
+        vsp.SetParmVal(b_id,"TopRStrength",xsec_names[pos], 0.)
+        vsp.SetParmVal(b_id,"RightRStrength",xsec_names[pos], 0.)
+        vsp.SetParmVal(b_id,"BottomRStrength",xsec_names[pos], 0.)
+        vsp.SetParmVal(b_id,"TopLStrength",xsec_names[pos+1], 0.)
+        vsp.SetParmVal(b_id,"RightLStrength",xsec_names[pos+1], 0.)            
 
     else:
-        vsp.SetParmVal(b_id,"TopLAngle","XSec_"+str(end_ind),vals.tail.top.angle)
-        vsp.SetParmVal(b_id,"TopLStrength","XSec_"+str(end_ind),vals.tail.top.strength)
-        vsp.SetParmVal(b_id,"AllSym","XSec_"+str(end_ind),1)
+        vsp.SetParmVal(b_id,"TopLAngle",xsec_names[end_ind],vals.tail.top.angle)
+        vsp.SetParmVal(b_id,"TopLStrength",xsec_names[end_ind],vals.tail.top.strength)
+        vsp.SetParmVal(b_id,"AllSym",xsec_names[end_ind],1)
         vsp.Update()
 
-
-    if 'z_pos' in vals.tail:
-        tail_z_pos = vals.tail.z_pos
-    else:
-        pass # use above default
-    
     vsp.SetSetFlag(b_id, OML_set_ind, True)
 
     return area_tags
 
 # ---------------------------------------------------------------------------------------------------------------------- 
-# set_section_angles 
+# compute_section_angles 
 # ---------------------------------------------------------------------------------------------------------------------- 
-def set_section_angles(i,nose_z,tail_z,x_poses,z_poses,heights,widths,length,end_ind,b_id):
-    """Set boom section angles to create a smooth (in the non-technical sense) boom shape.
-    Note that i of 0 corresponds to the first section that is not the end point.
+def compute_section_angles(x_poses,z_poses,heights,widths,length):
+    """Computes the top, bottom and side angles of all interior boom sections at once.
+    Entry i of each output corresponds to section i+1, with the angles taken from the 
+    sections on either side of it.
 
     Assumptions:
     May fail to give reasonable angles for very irregularly shaped booms
@@ -384,10 +372,55 @@ def set_section_angles(i,nose_z,tail_z,x_poses,z_poses,heights,widths,length,end
     N/A
 
     Inputs:  
-    nose_z   [-] # 0.1 is 10% of the boom length
-    widths   np.array of [m]
+    x_poses  np.array of [-] # 0.1 is 10% of the boom length
+    z_poses  np.array of [-] # 0.1 is 10% of the boom length
     heights  np.array of [m]
-    tail_z   [-] # 0.1 is 10% of the boom length
+    widths   np.array of [m]
+    length   [m]
+
+    Outputs:
+    top_angles   np.array of [degrees]
+    bot_angles   np.array of [degrees]
+    side_angles  np.array of [degrees]
+
+    Properties Used:
+    N/A
+    """    
+    x_poses = np.asarray(x_poses)*length
+    z_poses = np.asarray(z_poses)*length
+    heights = np.asarray(heights)
+    widths  = np.asarray(widths)
+
+    top_z_diff = (heights[2:]/2+z_poses[2:])-(heights[:-2]/2+z_poses[:-2])
+    bot_z_diff = (z_poses[2:]-heights[2:]/2)-(z_poses[:-2]-heights[:-2]/2)
+    y_diff     = widths[2:]/2-widths[:-2]/2
+    x_diff     = x_poses[2:]-x_poses[:-2]
+
+    top_angles  = np.arctan(top_z_diff/x_diff)/Units.deg
+    bot_angles  = np.arctan(-bot_z_diff/x_diff)/Units.deg
+    side_angles = np.arctan(y_diff/x_diff)/Units.deg
+
+    return top_angles, bot_angles, side_angles
+
+# ---------------------------------------------------------------------------------------------------------------------- 
+# set_section_angles 
+# ---------------------------------------------------------------------------------------------------------------------- 
+def set_section_angles(i,top_angle,bot_angle,side_angle,b_id):
+    """Set boom section angles to create a smooth (in the non-technical sense) boom shape.
+    Note that i of 0 corresponds to the first section that is not the end point.
+
+    Assumptions:
+    Angles are precomputed by compute_section_angles
+
+    Source:
+    N/A
+
+    Inputs:  
+    i          <int>
+    top_angle  [degrees]
+    bot_angle  [degrees]
+    side_angle [degrees]
+    b_id       <str>
 
     Outputs:
     Operates on the active OpenVSP model, no direct output
@@ -395,36 +428,14 @@ def set_section_angles(i,nose_z,tail_z,x_poses,z_poses,heights,widths,length,end
     Properties Used:
     N/A
     """    
-    w0 = widths[i]
-    h0 = heights[i]
-    x0 = x_poses[i]
-    z0 = z_poses[i]   
-    w2 = widths[i+2]
-    h2 = heights[i+2]
-    x2 = x_poses[i+2]
-    z2 = z_poses[i+2]
-
-    x0 = x0*length
-    x2 = x2*length
-    z0 = z0*length
-    z2 = z2*length
-
-    top_z_diff = (h2/2+z2)-(h0/2+z0)
-    bot_z_diff = (z2-h2/2)-(z0-h0/2)
-    y_diff     = w2/2-w0/2
-    x_diff     = x2-x0
-
-    top_angle  = np.tan(top_z_diff/x_diff)/Units.deg
-    bot_angle  = np.tan(-bot_z_diff/x_diff)/Units.deg
-    side_angle = np.tan(y_diff/x_diff)/Units.deg
-
-    vsp.SetParmVal(b_id,"TBSym","XSec_"+str(i+1),0)
-    vsp.SetParmVal(b_id,"TopLAngle","XSec_"+str(i+1),top_angle)
-    vsp.SetParmVal(b_id,"TopLStrength","XSec_"+str(i+1),0.75)
-    vsp.SetParmVal(b_id,"BottomLAngle","XSec_"+str(i+1),bot_angle)
-    vsp.SetParmVal(b_id,"BottomLStrength","XSec_"+str(i+1),0.75)   
-    vsp.SetParmVal(b_id,"RightLAngle","XSec_"+str(i+1),side_angle)
-    vsp.SetParmVal(b_id,"RightLStrength","XSec_"+str(i+1),0.75)   
+    xsec = "XSec_"+str(i+1)
+    vsp.SetParmVal(b_id,"TBSym",xsec,0)
+    vsp.SetParmVal(b_id,"TopLAngle",xsec,top_angle)
+    vsp.SetParmVal(b_id,"TopLStrength",xsec,0.75)
+    vsp.SetParmVal(b_id,"BottomLAngle",xsec,bot_angle)
+    vsp.SetParmVal(b_id,"BottomLStrength",xsec,0.75)   
+    vsp.SetParmVal(b_id,"RightLAngle",xsec,side_angle)
+    vsp.SetParmVal(b_id,"RightLStrength",xsec,0.75)   
 
     return  
 
@@ -454,23 +465,22 @@ def compute_boom_fineness(boom, x_locs, eff_diams, eff_diam_gradients_fwd):
     N/A
     """
 
-    segment_list       = list(boom.segments.keys())
+    first_segment      = next(iter(boom.segments.values()))
     
     # Compute nose fineness.    
-    x_locs    = np.array(x_locs)					# Make numpy arrays.
-    eff_diams = np.array(eff_diams)
-    min_val   = np.min(eff_diam_gradients_fwd[x_locs[:-1]<=0.5])	# Computes smallest eff_diam gradient value in front 50% of boom.
-    x_loc     = x_locs[:-1][eff_diam_gradients_fwd==min_val][0]		# Determines x-location of the first instance of that value (if gradient=0, Segments[segment_list[0]]ost x-loc).
-    boom.lengths.nose  = (x_loc-boom.segments[segment_list[0]].percent_x_location)*boom.lengths.total	# Subtracts first segment x-loc in case not at global origin.
-    boom.fineness.nose = boom.lengths.nose/(eff_diams[x_locs==x_loc][0])
+    x_locs    = np.asarray(x_locs)					# Make numpy arrays (no copy if already arrays).
+    eff_diams = np.asarray(eff_diams)
+    eff_diam_gradients_fwd = np.asarray(eff_diam_gradients_fwd)
+    nose_gradients = np.where(x_locs[:-1]<=0.5,eff_diam_gradients_fwd,np.inf)	# Only the front 50% of boom is searched.
+    x_loc     = x_locs[np.argmin(nose_gradients)]		# x-location of the first instance of the smallest gradient (if gradient=0, fore-most x-loc).
+    boom.lengths.nose  = (x_loc-first_segment.percent_x_location)*boom.lengths.total	# Subtracts first segment x-loc in case not at global origin.
+    boom.fineness.nose = boom.lengths.nose/(eff_diams[np.searchsorted(x_locs,x_loc)])
 
     # Compute tail fineness.
-    x_locs_tail		    = x_locs>=0.5						# Searches aft 50% of boom.
-    eff_diam_gradients_fwd_tail = eff_diam_gradients_fwd[x_locs_tail[1:]]			# Smaller array of tail gradients.
-    min_val 		    = np.min(-eff_diam_gradients_fwd_tail)			# Computes min gradient, where boom tapers (minus sign makes positive).
-    x_loc = x_locs[np.hstack([False,-eff_diam_gradients_fwd==min_val])][-1]			# Saves aft-most value (useful for straight boom with multiple zero gradients.)
+    tail_gradients = np.where(x_locs[1:]>=0.5,-eff_diam_gradients_fwd,np.inf)	# Searches aft 50% of boom, where boom tapers (minus sign makes positive).
+    x_loc = x_locs[len(tail_gradients) - np.argmin(tail_gradients[::-1])]	# Saves aft-most value (useful for straight boom with multiple zero gradients.)
     boom.lengths.tail       = (1.-x_loc)*boom.lengths.total
-    boom.fineness.tail      = boom.lengths.tail/(eff_diams[x_locs==x_loc][0])	# Minus sign converts tail fineness to positive value.
+    boom.fineness.tail      = boom.lengths.tail/(eff_diams[np.searchsorted(x_locs,x_loc)])	# Minus sign converts tail fineness to positive value.
 
     return boom
 
@@ -488,27 +498,26 @@ def get_boom_height(boom, location):
 
     Inputs:
     0. Pre-loaded VSP vehicle in memory, via import_vsp_vehicle.
-    1. RCAIDE boom [object], containing boom.vsp_data.xsec_num in its data structure.
-    2. boom percentage point [float].
+    1. RCAIDE boom [object], containing segments with percent_x_location and height.
+    2. boom percentage point [float], must lie between the first and last section percent_x_location.
 
     Outputs:
     height [m]
 
+    Raises ValueError for a location outside the section range instead of extrapolating or clamping to the end heights.
+    Kept as public API alongside get_fuselage_height, although the boom reader no longer calls it.
+
     Properties Used:
     N/A
     """
 
-    segment_list   = list(boom.segments.keys())       
-    for jj in range(1, boom.vsp_data.xsec_num):		# Begin at second section, working toward tail.
-        if boom.segments[segment_list[jj]].percent_x_location>=location and boom.segments[segment_list[jj-1]].percent_x_location<location:  
-            # Find two sections on either side (or including) the desired boom length percentage.
-            a        = boom.segments[segment_list[jj]].percent_x_location							
-            b        = boom.segments[segment_list[jj-1]].percent_x_location
-            a_height = boom.segments[segment_list[jj]].height		# Linear approximation.
-            b_height = boom.segments[segment_list[jj-1]].height
-            slope    = (a_height - b_height)/(a-b)
-            height   = ((location-b)*(slope)) + (b_height)	
-            break
+    # Linear approximation between the two sections on either side (or including) the desired boom length percentage.
+    segments = boom.segments.values()
+    x_locs   = np.array([segment.percent_x_location for segment in segments])
+    heights  = np.array([segment.height for segment in segments])
+    if not x_locs[0] <= location <= x_locs[-1]:
+        raise ValueError('Boom location ' + str(location) + ' is outside the section range [' + str(x_locs[0]) + ', ' + str(x_locs[-1]) + '].')
+    height   = np.interp(location, x_locs, heights)
     return height
 
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -538,17 +547,21 @@ def find_fuse_u_coordinate(x_target,b_id,fuel_tank_tag):
     diff  = 1000    
     u_min = 0
     u_max = 1    
+    
+    # a single probe is created for the search and moved along the boom through its u parm
+    probe_id = vsp.AddProbe(b_id,0,(u_max+u_min)/2,0,fuel_tank_tag+'_probe')
+    u_id     = vsp.FindParm(probe_id,'U','Measure')
+    x_id     = vsp.FindParm(probe_id,'X','Measure')
     while np.abs(diff) > tol:
         u_current = (u_max+u_min)/2
-        probe_id = vsp.AddProbe(b_id,0,u_current,0,fuel_tank_tag+'_probe')
+        vsp.SetParmVal(u_id,u_current)
         vsp.Update()
-        x_id  = vsp.FindParm(probe_id,'X','Measure')
         x_pos = vsp.GetParmVal(x_id) 
         diff = x_target-x_pos
         if diff > 0:
             u_min = u_current
         else:
             u_max = u_current
-        vsp.DelProbe(probe_id)
+    vsp.DelProbe(probe_id)
     return u_current
 
@@ -508,9 +508,9 @@ def set_section_angles(i,nose_z,tail_z,x_poses,z_poses,heights,widths,length,end
     y_diff     = w2/2-w0/2
     x_diff     = x2-x0
 
-    top_angle  = np.tan(top_z_diff/x_diff)/Units.deg / divider
-    bot_angle  = np.tan(-bot_z_diff/x_diff)/Units.deg / divider
-    side_angle = np.tan(y_diff/x_diff)/Units.deg/ divider
+    top_angle  = np.arctan(top_z_diff/x_diff)/Units.deg / divider
+    bot_angle  = np.arctan(-bot_z_diff/x_diff)/Units.deg / divider
+    side_angle = np.arctan(y_diff/x_diff)/Units.deg/ divider
 
     vsp.SetParmVal(fuse_id,"TBSym","XSec_"+str(i+1),0)
     vsp.SetParmVal(fuse_id,"TopLAngle","XSec_"+str(i+1),top_angle)
@@ -12,6 +12,7 @@ from RCAIDE.Framework.Core import Units , Data
 import numpy as np
 import scipy as sp
 import string
+import io
 try:
     import vsp as vsp
 except ImportError:
@@ -121,50 +122,49 @@ def read_vsp_rotor(prop_id, units_type='SI',write_airfoil_file=True):
     rotor.orientation_euler_angles[1] 	= vsp.GetParmVal(prop_id, 'Y_Rotation', 'XForm') * Units.degrees
     rotor.orientation_euler_angles[2] 	= vsp.GetParmVal(prop_id, 'Z_Rotation', 'XForm') * Units.degrees
 
-    # Get the rotor parameter IDs
+    # Map the rotor parameter names to their IDs (first occurrence wins)
     parm_id    = vsp.GetGeomParmIDs(prop_id)
-    parm_names = []
-    for i in range(len(parm_id)):
-        parm_name = vsp.GetParmName(parm_id[i])
-        parm_names.append(parm_name)
+    name_to_id = {vsp.GetParmName(pid): pid for pid in reversed(parm_id)}
 
     # Run the vsp Blade Element analysis
     vsp.SetStringAnalysisInput( "BladeElement" , "PropID" , (prop_id,) )
     rid = vsp.ExecAnalysis( "BladeElement" )
     Nc  = len(vsp.GetDoubleResults(rid,"YSection_000"))
 
+    # Fetch each sectional distribution from the results once
+    bem = {key: np.array(vsp.GetDoubleResults(rid, key))
+           for key in ("Radius","Chord","Twist","Sweep","Thick","CLi","Rake","Skew","Axial","Tangential")}
+
     rotor.vtk_airfoil_points           = 2*Nc
-    rotor.CLi                          = vsp.GetParmVal(parm_id[parm_names.index('CLi')])
-    rotor.blade_solidity               = vsp.GetParmVal(parm_id[parm_names.index('Solidity')])
-    rotor.number_of_blades             = int(vsp.GetParmVal(parm_id[parm_names.index('NumBlade')]))
+    rotor.CLi                          = vsp.GetParmVal(name_to_id['CLi'])
+    rotor.blade_solidity               = vsp.GetParmVal(name_to_id['Solidity'])
+    rotor.number_of_blades             = int(vsp.GetParmVal(name_to_id['NumBlade']))
 
     rotor.tip_radius                   = vsp.GetDoubleResults(rid, "Diameter" )[0] / 2 * units_factor
-    rotor.radius_distribution          = np.array(vsp.GetDoubleResults(rid, "Radius" )) * rotor.tip_radius
+    bem["Radius"][-1]                  = 0.99 # BEMT requires max nondimensional radius to be less than 1.0
 
-    rotor.radius_distribution[-1]      = 0.99 * rotor.tip_radius # BEMT requires max nondimensional radius to be less than 1.0
-    if rotor.radius_distribution[0] == 0.:
-        start = 1
-        rotor.radius_distribution = rotor.radius_distribution[start:]
-    else:
-        start = 0
+    # Drop a root station at zero radius from every distribution
+    sl  = slice(1, None) if bem["Radius"][0] == 0. else slice(0, None)
+    bem = {key: values[sl] for key, values in bem.items()}
 
+    rotor.radius_distribution          = bem["Radius"] * rotor.tip_radius
     rotor.hub_radius                   = rotor.radius_distribution[0]
 
-    rotor.chord_distribution           = np.array(vsp.GetDoubleResults(rid, "Chord" ))[start:]  * rotor.tip_radius # vsp gives c/R
-    rotor.twist_distribution           = np.array(vsp.GetDoubleResults(rid, "Twist" ))[start:]  * Units.degrees
-    rotor.sweep_distribution           = np.array(vsp.GetDoubleResults(rid, "Sweep" ))[start:]
+    rotor.chord_distribution           = bem["Chord"]  * rotor.tip_radius # vsp gives c/R
+    rotor.twist_distribution           = bem["Twist"]  * Units.degrees
+    rotor.sweep_distribution           = bem["Sweep"]
     rotor.mid_chord_alignment          = np.tan(rotor.sweep_distribution*Units.degrees)  * rotor.radius_distribution
-    rotor.thickness_to_chord           = np.array(vsp.GetDoubleResults(rid, "Thick" ))[start:]
+    rotor.thickness_to_chord           = bem["Thick"]
     rotor.max_thickness_distribution   = rotor.thickness_to_chord*rotor.chord_distribution * units_factor
-    rotor.Cl_distribution              = np.array(vsp.GetDoubleResults(rid, "CLi" ))[start:]
+    rotor.Cl_distribution              = bem["CLi"]
 
     # Extra data from VSP BEM for future use in BEVW
     rotor.beta34                       = vsp.GetDoubleResults(rid, "Beta34" )[0]  # pitch at 3/4 radius
     rotor.pre_cone                     = vsp.GetDoubleResults(rid, "Pre_Cone")[0]
-    rotor.rake                         = np.array(vsp.GetDoubleResults(rid, "Rake"))[start:]
-    rotor.skew                         = np.array(vsp.GetDoubleResults(rid, "Skew"))[start:]
-    rotor.axial                        = np.array(vsp.GetDoubleResults(rid, "Axial"))[start:]
-    rotor.tangential                   = np.array(vsp.GetDoubleResults(rid, "Tangential"))[start:]
+    rotor.rake                         = bem["Rake"]
+    rotor.skew                         = bem["Skew"]
+    rotor.axial                        = bem["Axial"]
+    rotor.tangential                   = bem["Tangential"]
 
     # Set rotor rotation
     rotor.rotation = 1
@@ -195,7 +195,6 @@ def write_vsp_rotor_bem(vsp_bem_filename,rotor):
     Properties Used:
         N/A
     """
-    vsp_bem = open(vsp_bem_filename,'w')
     with open(vsp_bem_filename,'w') as vsp_bem:
         make_header_text(vsp_bem, rotor)
 
@@ -232,29 +231,29 @@ def make_header_text(vsp_bem,rotor):
 '''...{0}...
 Num_Sections: {1}
 Num_Blade: {2}
-Diameter: {3}
-Beta 3/4 (deg): {4}
+Diameter: {3:.5f}
+Beta 3/4 (deg): {4:.5f}
 Feather (deg): 0.00000000
 Pre_Cone (deg): 0.00000000
-Center: {5}, {6}, {7}
-Normal: {8}, {9}, {10}
+Center: {5:.5f}, {6:.5f}, {7:.5f}
+Normal: {8:.5f}, {9:.5f}, {10:.5f}
 '''
     # Unpack inputs
     name      = rotor.tag
     N         = len(rotor.radius_distribution)
     B         = int(rotor.number_of_blades)
-    D         = np.round(rotor.tip_radius*2,5)
-    beta      = np.round(rotor.twist_distribution/Units.degrees,5)
-    X         = np.round(rotor.origin[0][0],5)
-    Y         = np.round(rotor.origin[0][1],5)
-    Z         = np.round(rotor.origin[0][2],5) 
-    Xn        = np.round(rotor.orientation_euler_angles[2],5) / Units.degrees
-    Yn        = np.round(rotor.orientation_euler_angles[0],5) / Units.degrees 
-    Zn        = np.round(rotor.orientation_euler_angles[1],5) / Units.degrees
+    D         = rotor.tip_radius*2
+    beta      = rotor.twist_distribution/Units.degrees
+    X         = rotor.origin[0][0]
+    Y         = rotor.origin[0][1]
+    Z         = rotor.origin[0][2]
+    Xn        = rotor.orientation_euler_angles[2] / Units.degrees
+    Yn        = rotor.orientation_euler_angles[0] / Units.degrees
+    Zn        = rotor.orientation_euler_angles[1] / Units.degrees
 
     beta_3_4  = np.interp(rotor.tip_radius*0.75,rotor.radius_distribution,beta)
 
-    # Insert inputs into the template
+    # Insert inputs into the template, rounded to five decimals
     header_text = header_base.format(name,N,B,D,beta_3_4,X,Y,Z,Xn,Yn,Zn)
     vsp_bem.write(header_text)
 
@@ -283,34 +282,29 @@ def make_section_text(vsp_bem,rotor):
         '''Radius/R, Chord/R, Twist (deg), Rake/R, Skew/R, Sweep, t/c, CLi, Axial, Tangential\n'''
 
     N          = len(rotor.radius_distribution)
-    r_R        = np.zeros(N)
-    c_R        = np.zeros(N)
+    zeros      = np.zeros(N)
     r_R        = rotor.radius_distribution/rotor.tip_radius
     c_R        = rotor.chord_distribution/rotor.tip_radius
     beta_deg   = rotor.twist_distribution/Units.degrees
-    Rake_R     = np.zeros(N)
-    Skew_R     = np.zeros(N)
+    Rake_R     = zeros
+    Skew_R     = zeros
     Sweep      = np.arctan(rotor.mid_chord_alignment/rotor.radius_distribution)
     t_c        = rotor.thickness_to_chord
     
-    if type(rotor) == RCAIDE.Library.Components.Propulsors.Converters.Lift_Rotor: 
-        CLi        = np.ones(N)*rotor.hover.design_Cl  
-    elif type(rotor) == RCAIDE.Library.Components.Propulsors.Converters.Propeller:
-        CLi        = np.ones(N)*rotor.cruise.design_Cl   
-    elif type(rotor) == RCAIDE.Library.Components.Propulsors.Converters.Prop_Rotor: 
-        CLi        = np.ones(N)*rotor.hover.design_Cl  
+    # Operating condition each rotor type is designed at
+    Converters        = RCAIDE.Library.Components.Propulsors.Converters
+    design_conditions = {Converters.Lift_Rotor: 'hover',
+                         Converters.Propeller:  'cruise',
+                         Converters.Prop_Rotor: 'hover'}
+    CLi        = np.full(N,rotor[design_conditions[type(rotor)]].design_Cl)
     
-    Axial      = np.zeros(N)
-    Tangential = np.zeros(N)
+    Axial      = zeros
+    Tangential = zeros
 
     # Write rotor station imformation
     vsp_bem.write(header)
-    for i in range(N):
-        section_text = format(r_R[i], '.7f')+ ", " + format(c_R[i], '.7f')+ ", " + format(beta_deg[i], '.7f')+ ", " +\
-            format( Rake_R[i], '.7f')+ ", " + format(Skew_R[i], '.7f')+ ", " + format(Sweep[i], '.7f')+ ", " +\
-            format(t_c[i], '.7f')+ ", " + format(CLi[i], '.7f') + ", "+ format(Axial[i], '.7f') + ", " +\
-            format(Tangential[i], '.7f') + "\n"
-        vsp_bem.write(section_text)
+    section_data = np.column_stack((r_R,c_R,beta_deg,Rake_R,Skew_R,Sweep,t_c,CLi,Axial,Tangential))
+    np.savetxt(vsp_bem,section_data,fmt='%.7f',delimiter=', ',newline='\n')
 
     return
 
@@ -338,15 +332,18 @@ def make_airfoil_text(vsp_bem,rotor):
     airfoils      = rotor.airfoils
     airfoil_list  = list(airfoils.keys())
     a_sec         = rotor.airfoil_polar_stations
+    airfoil_texts = {}
     for i in range(N):
         airfoil_station_header = '\nSection ' + str(i) + ' X, Y\n'
         vsp_bem.write(airfoil_station_header)
         airfoil_index =  a_sec[i]
-        airfoil       = airfoils[airfoil_list[airfoil_index]]
-        airfoil_x     = airfoil.geometry.x_coordinates 
-        airfoil_y     = airfoil.geometry.y_coordinates 
 
-        for j in range(len(airfoil_x)):
-            section_text = format(airfoil_x[j], '.7f')+ ", " + format(airfoil_y[j], '.7f') + "\n"
-            vsp_bem.write(section_text)
+        # Format each airfoil's coordinates only once, stations often share an airfoil
+        if airfoil_index not in airfoil_texts:
+            airfoil       = airfoils[airfoil_list[airfoil_index]]
+            airfoil_xy    = np.column_stack((airfoil.geometry.x_coordinates,airfoil.geometry.y_coordinates))
+            airfoil_text  = io.StringIO()
+            np.savetxt(airfoil_text,airfoil_xy,fmt='%.7f',delimiter=', ',newline='\n')
+            airfoil_texts[airfoil_index] = airfoil_text.getvalue()
+        vsp_bem.write(airfoil_texts[airfoil_index])
     return
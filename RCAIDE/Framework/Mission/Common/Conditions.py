@@ -11,6 +11,7 @@ from RCAIDE.Framework.Core                    import Data
 
 # python imports 
 import numpy as np 
+from warnings import warn
 # ----------------------------------------------------------------------------------------------------------------------
 #  Conditions
 # ----------------------------------------------------------------------------------------------------------------------
@@ -28,6 +29,32 @@ class Conditions(Data):
 
     _size = 1
     
+    def __setattr__(self,k,v):
+        """ Sets an attribute. The mission update functions reassign the same condition fields on every solver
+            iteration, so an existing field is stored directly instead of first probing for an object attribute
+            with the same name as Data.__setattr__ does
+        
+            Assumptions:
+            A key is never also an object attribute
+    
+            Source:
+            N/A
+    
+            Inputs:
+            k      [key]
+            v      [value]
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        if k in self:
+            self[k] = v
+        else:
+            Data.__setattr__(self,k,v)
+    
     def ones_row(self,cols):
         """ returns a row vector of ones with given number of columns 
         
@@ -48,6 +75,102 @@ class Conditions(Data):
         """     
         return np.ones([self._size,cols])
     
+    def zeros_row(self,cols):
+        """ returns a row vector of zeros with given number of columns 
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            cols   [int]
+    
+            Outputs:
+            Vector
+    
+            Properties Used:
+            None
+        """     
+        return np.zeros((self._size,cols))
+    
+    def full_row(self,cols,value):
+        """ returns a row vector filled with a given value with given number of columns, in a single allocation
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            cols   [int]
+            value  [float]
+    
+            Outputs:
+            Vector
+    
+            Properties Used:
+            None
+        """     
+        return np.full([self._size,cols],value,dtype=float)
+    
+    def pack_array(self,output='vector'):
+        """ maps the conditions to a 1D vector. Unknowns and residuals are trees of 2D column arrays, so these are
+            gathered once and raveled into a single contiguous vector. Anything else falls back to Data.pack_array
+        
+            Assumptions:
+            Same ordering as Data.pack_array
+    
+            Source:
+            N/A
+    
+            Inputs:
+            output - either 'vector' (default), or 'array'
+    
+            Outputs:
+            array  - the packed array
+    
+            Properties Used:
+            None
+        """
+        columns = []
+        if output != 'vector' or not gather_columns(self,columns):
+            return Data.pack_array(self,output)
+        if not columns:
+            return np.array([])
+        return np.concatenate([v.ravel(order='F') for v in columns])
+    
+    def unpack_array(self,M):
+        """ unpacks a 1D vector into the conditions in place, the inverse of pack_array
+        
+            Assumptions:
+            The structure of the conditions is the same as when the vector was packed
+    
+            Source:
+            N/A
+    
+            Inputs:
+            M      - 1D vector
+    
+            Outputs:
+            a reference to self, updates self in place
+    
+            Properties Used:
+            None
+        """
+        columns = []
+        if M.ndim != 1 or not gather_columns(self,columns):
+            return Data.unpack_array(self,M)
+        index = 0
+        for v in columns:
+            n,m          = v.shape
+            v[:,:]       = np.reshape(M[index:(index+n*m)],[n,m],order='F')
+            index       += n*m
+        if not M.shape[-1] == index: warn('did not unpack all values',RuntimeWarning)
+        return self
+    
     def ones_row_m1(self,cols):
         """ returns an N-1 row vector of ones with given number of columns
         
@@ -269,6 +392,37 @@ class expanded_array(Data):
         
         self._array = np.resize(other,[1,1])
         
-        return self    
-        
-    
\ No newline at end of file
+        return self
+
+# ----------------------------------------------------------------------------------------------------------------------
+# gather_columns
+# ---------------------------------------------------------------------------------------------------------------------- 
+
+def gather_columns(D,columns):
+    """ Collects the 2D arrays of a conditions tree, in packing order, into a list. Returns False if the tree holds
+        anything Data.pack_array would treat differently (scalars, 1D vectors, matrices or higher rank arrays)
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        D       [Data]
+        columns [list]
+
+        Outputs:
+        flat    [boolean]
+    """
+    for v in D.values():
+        if isinstance(v,dict):
+            if not gather_columns(v,columns):
+                return False
+        elif isinstance(v,np.ndarray):
+            if v.ndim != 2 or isinstance(v,np.matrix):
+                return False
+            columns.append(v)
+        elif isinstance(v,(int,float)):
+            return False
+    return True
@@ -14,6 +14,11 @@ from RCAIDE.Framework.Mission.Common import Conditions
 # python imports
 import numpy as np
 
+# placeholder for the frame transforms until orientations are first computed; shared by every Results and always
+# replaced rather than written into, so it is made read-only
+_empty_transform                 = np.empty((0,0,0))
+_empty_transform.flags.writeable = False
+
 # ----------------------------------------------------------------------------------------------------------------------
 # Results
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -68,20 +73,19 @@ class Results(Conditions):
         
         self.tag                                              = 'results' 
  
-        # start default row vectors
-        ones_1col                                             = self.ones_row(1)  
-        ones_3col                                             = self.ones_row(3)
+        # start default row vectors, each field gets its own zero array
+        zeros_row                                             = self.zeros_row
         
         # ----------------------------------------------------------------------------------------------------------------------         
         # Reference Values 
         # ---------------------------------------------------------------------------------------------------------------------- 
     
-        self.S_ref                                            = ones_1col * 0
-        self.c_ref                                            = ones_1col * 0
-        self.b_ref                                            = ones_1col * 0
-        self.X_ref                                            = ones_1col * 0
-        self.Y_ref                                            = ones_1col * 0
-        self.Z_ref                                            = ones_1col * 0     
+        self.S_ref                                            = zeros_row(1)
+        self.c_ref                                            = zeros_row(1)
+        self.b_ref                                            = zeros_row(1)
+        self.X_ref                                            = zeros_row(1)
+        self.Y_ref                                            = zeros_row(1)
+        self.Z_ref                                            = zeros_row(1)     
         
         # ----------------------------------------------------------------------------------------------------------------------         
         # Frames 
@@ -90,62 +94,62 @@ class Results(Conditions):
         
         # inertial conditions
         self.frames.inertial                                                   = Conditions()        
-        self.frames.inertial.position_vector                                   = ones_3col * 0
-        self.frames.inertial.velocity_vector                                   = ones_3col * 0
-        self.frames.inertial.acceleration_vector                               = ones_3col * 0
-        self.frames.inertial.angular_velocity_vector                           = ones_3col * 0
-        self.frames.inertial.angular_acceleration_vector                       = ones_3col * 0
-        self.frames.inertial.gravity_force_vector                              = ones_3col * 0
-        self.frames.inertial.total_force_vector                                = ones_3col * 0
-        self.frames.inertial.total_moment_vector                               = ones_3col * 0
-        self.frames.inertial.time                                              = ones_1col * 0
-        self.frames.inertial.aircraft_range                                    = ones_1col * 0
+        self.frames.inertial.position_vector                                   = zeros_row(3)
+        self.frames.inertial.velocity_vector                                   = zeros_row(3)
+        self.frames.inertial.acceleration_vector                               = zeros_row(3)
+        self.frames.inertial.angular_velocity_vector                           = zeros_row(3)
+        self.frames.inertial.angular_acceleration_vector                       = zeros_row(3)
+        self.frames.inertial.gravity_force_vector                              = zeros_row(3)
+        self.frames.inertial.total_force_vector                                = zeros_row(3)
+        self.frames.inertial.total_moment_vector                               = zeros_row(3)
+        self.frames.inertial.time                                              = zeros_row(1)
+        self.frames.inertial.aircraft_range                                    = zeros_row(1)
 
                                                                                
         # body conditions                                                      
         self.frames.body                                                       = Conditions()        
-        self.frames.body.inertial_rotations                                    = ones_3col * 0
-        self.frames.body.thrust_force_vector                                   = ones_3col * 0
-        self.frames.body.moment_vector                                         = ones_3col * 0
-        self.frames.body.velocity_vector                                       = ones_3col * 0
-        self.frames.body.thrust_moment_vector                                  = ones_3col * 0 
-        self.frames.body.transform_to_inertial                                 = np.empty([0,0,0])
+        self.frames.body.inertial_rotations                                    = zeros_row(3)
+        self.frames.body.thrust_force_vector                                   = zeros_row(3)
+        self.frames.body.moment_vector                                         = zeros_row(3)
+        self.frames.body.velocity_vector                                       = zeros_row(3)
+        self.frames.body.thrust_moment_vector                                  = zeros_row(3) 
+        self.frames.body.transform_to_inertial                                 = _empty_transform
                                                                                
         # wind frame conditions                                                
         self.frames.wind                                                       = Conditions()
-        self.frames.wind.body_rotations                                        = ones_3col * 0 # rotations in [X,Y,Z] -> [phi,theta,psi]
-        self.frames.wind.velocity_vector                                       = ones_3col * 0
-        self.frames.wind.force_vector                                          = ones_3col * 0
-        self.frames.wind.moment_vector                                         = ones_3col * 0
-        self.frames.wind.transform_to_inertial                                 = np.empty([0,0,0]) 
+        self.frames.wind.body_rotations                                        = zeros_row(3) # rotations in [X,Y,Z] -> [phi,theta,psi]
+        self.frames.wind.velocity_vector                                       = zeros_row(3)
+        self.frames.wind.force_vector                                          = zeros_row(3)
+        self.frames.wind.moment_vector                                         = zeros_row(3)
+        self.frames.wind.transform_to_inertial                                 = _empty_transform 
                                                                                
         # planet frame conditions                                              
         self.frames.planet                                                     = Conditions()
         self.frames.planet.start_time                                          = None
-        self.frames.planet.latitude                                            = ones_1col * 0
-        self.frames.planet.longitude                                           = ones_1col * 0
-        self.frames.planet.true_course                                         = ones_1col * 0
-        self.frames.planet.true_heading                                        = ones_1col * 0
+        self.frames.planet.latitude                                            = zeros_row(1)
+        self.frames.planet.longitude                                           = zeros_row(1)
+        self.frames.planet.true_course                                         = zeros_row(1)
+        self.frames.planet.true_heading                                        = zeros_row(1)
 
         # ----------------------------------------------------------------------------------------------------------------------         
         # Freestream 
         # ----------------------------------------------------------------------------------------------------------------------    
         self.freestream                                                        = Conditions()        
-        self.freestream.velocity                                               = ones_1col * 0
-        self.freestream.u                                                      = ones_1col * 0
-        self.freestream.v                                                      = ones_1col * 0
-        self.freestream.w                                                      = ones_1col * 0
-        self.freestream.mach_number                                            = ones_1col * 0
-        self.freestream.pressure                                               = ones_1col * 0
-        self.freestream.temperature                                            = ones_1col * 0
-        self.freestream.density                                                = ones_1col * 0
-        self.freestream.speed_of_sound                                         = ones_1col * 0
-        self.freestream.dynamic_viscosity                                      = ones_1col * 0
-        self.freestream.altitude                                               = ones_1col * 0
-        self.freestream.gravity                                                = ones_1col * 0
-        self.freestream.reynolds_number                                        = ones_1col * 0
-        self.freestream.dynamic_pressure                                       = ones_1col * 0
-        self.freestream.delta_ISA                                              = ones_1col * 0
+        self.freestream.velocity                                               = zeros_row(1)
+        self.freestream.u                                                      = zeros_row(1)
+        self.freestream.v                                                      = zeros_row(1)
+        self.freestream.w                                                      = zeros_row(1)
+        self.freestream.mach_number                                            = zeros_row(1)
+        self.freestream.pressure                                               = zeros_row(1)
+        self.freestream.temperature                                            = zeros_row(1)
+        self.freestream.density                                                = zeros_row(1)
+        self.freestream.speed_of_sound                                         = zeros_row(1)
+        self.freestream.dynamic_viscosity                                      = zeros_row(1)
+        self.freestream.altitude                                               = zeros_row(1)
+        self.freestream.gravity                                                = zeros_row(1)
+        self.freestream.reynolds_number                                        = zeros_row(1)
+        self.freestream.dynamic_pressure                                       = zeros_row(1)
+        self.freestream.delta_ISA                                              = zeros_row(1)
 
         # ----------------------------------------------------------------------------------------------------------------------         
         # Aerodynamics
@@ -154,14 +158,9 @@ class Results(Conditions):
                                                                                
         # aerdynamic angles                                                    
         self.aerodynamics.angles                                               = Conditions()
-        self.aerodynamics.angles.alpha                                         = ones_1col * 0
-        self.aerodynamics.angles.beta                                          = ones_1col * 0
-        self.aerodynamics.angles.phi                                           = ones_1col * 0 
-                                                                               
-        # aerodynamic coefficients                                             
-        self.aerodynamics.coefficients                                         = Conditions()
-        self.aerodynamics.coefficients.lift                                    = ones_1col * 0
-        self.aerodynamics.coefficients.drag                                    = ones_1col * 0     
+        self.aerodynamics.angles.alpha                                         = zeros_row(1)
+        self.aerodynamics.angles.beta                                          = zeros_row(1)
+        self.aerodynamics.angles.phi                                           = zeros_row(1) 
                                                                                
         # aerodynamic coefficients                                             
         self.aerodynamics.coefficients                                         = Conditions()
@@ -172,22 +171,22 @@ class Results(Conditions):
         self.aerodynamics.coefficients.lift.induced.inviscid_wings             = Conditions()
         self.aerodynamics.coefficients.lift.compressible_wings                 = Conditions() 
         self.aerodynamics.coefficients.drag                                    = Conditions()  
-        self.aerodynamics.coefficients.drag.total                              = ones_1col * 0   
+        self.aerodynamics.coefficients.drag.total                              = zeros_row(1)   
         self.aerodynamics.coefficients.drag.parasite                           = Conditions()
         self.aerodynamics.coefficients.drag.compressible                       = Conditions()
         self.aerodynamics.coefficients.drag.induced                            = Conditions()
-        self.aerodynamics.coefficients.drag.induced.total                      = ones_1col * 0 
-        self.aerodynamics.coefficients.drag.induced.inviscid                   = ones_1col * 0 
+        self.aerodynamics.coefficients.drag.induced.total                      = zeros_row(1) 
+        self.aerodynamics.coefficients.drag.induced.inviscid                   = zeros_row(1) 
         self.aerodynamics.coefficients.drag.induced.inviscid_wings             = Conditions()
         self.aerodynamics.coefficients.drag.cooling                            = Conditions()
-        self.aerodynamics.coefficients.drag.cooling.total                      = ones_1col * 0
+        self.aerodynamics.coefficients.drag.cooling.total                      = zeros_row(1)
         self.aerodynamics.coefficients.drag.windmilling                        = Conditions()
-        self.aerodynamics.coefficients.drag.windmilling.total                  = ones_1col * 0
+        self.aerodynamics.coefficients.drag.windmilling.total                  = zeros_row(1)
         self.aerodynamics.coefficients.drag.asymmetry_trim                     = Conditions()
-        self.aerodynamics.coefficients.drag.asymmetry_trim.total               = ones_1col * 0 
+        self.aerodynamics.coefficients.drag.asymmetry_trim.total               = zeros_row(1) 
         
-        self.aerodynamics.coefficients.drag.induced.efficiency_factor          = ones_1col * 0 
-        self.aerodynamics.oswald_efficiency                                    = ones_1col * 0 
+        self.aerodynamics.coefficients.drag.induced.efficiency_factor          = zeros_row(1) 
+        self.aerodynamics.oswald_efficiency                                    = zeros_row(1) 
  
         # ----------------------------------------------------------------------------------------------------------------------
         # Control Surfaces 
@@ -195,224 +194,223 @@ class Results(Conditions):
         self.control_surfaces                                                  = Conditions()
 
         self.control_surfaces.aileron                                          = Conditions()
-        self.control_surfaces.aileron.deflection                               = ones_1col * 0 
+        self.control_surfaces.aileron.deflection                               = zeros_row(1) 
         self.control_surfaces.aileron.static_stability                         = Conditions()
         self.control_surfaces.aileron.static_stability.coefficients            = Conditions() 
-        self.control_surfaces.aileron.static_stability.coefficients.lift       = ones_1col * 0        
-        self.control_surfaces.aileron.static_stability.coefficients.drag       = ones_1col * 0           
-        self.control_surfaces.aileron.static_stability.coefficients.X          = ones_1col * 0           
-        self.control_surfaces.aileron.static_stability.coefficients.Y          = ones_1col * 0           
-        self.control_surfaces.aileron.static_stability.coefficients.Z          = ones_1col * 0         
-        self.control_surfaces.aileron.static_stability.coefficients.L          = ones_1col * 0         
-        self.control_surfaces.aileron.static_stability.coefficients.M          = ones_1col * 0         
-        self.control_surfaces.aileron.static_stability.coefficients.N          = ones_1col * 0           
-        self.control_surfaces.aileron.static_stability.coefficients.e          = ones_1col * 0
+        self.control_surfaces.aileron.static_stability.coefficients.lift       = zeros_row(1)        
+        self.control_surfaces.aileron.static_stability.coefficients.drag       = zeros_row(1)           
+        self.control_surfaces.aileron.static_stability.coefficients.X          = zeros_row(1)           
+        self.control_surfaces.aileron.static_stability.coefficients.Y          = zeros_row(1)           
+        self.control_surfaces.aileron.static_stability.coefficients.Z          = zeros_row(1)         
+        self.control_surfaces.aileron.static_stability.coefficients.L          = zeros_row(1)         
+        self.control_surfaces.aileron.static_stability.coefficients.M          = zeros_row(1)         
+        self.control_surfaces.aileron.static_stability.coefficients.N          = zeros_row(1)           
+        self.control_surfaces.aileron.static_stability.coefficients.e          = zeros_row(1)
         
         self.control_surfaces.elevator                                         = Conditions()
-        self.control_surfaces.elevator.deflection                              = ones_1col * 0 
+        self.control_surfaces.elevator.deflection                              = zeros_row(1) 
         self.control_surfaces.elevator.static_stability                        = Conditions()
         self.control_surfaces.elevator.static_stability.coefficients           = Conditions() 
-        self.control_surfaces.elevator.static_stability.coefficients.lift      = ones_1col * 0        
-        self.control_surfaces.elevator.static_stability.coefficients.drag      = ones_1col * 0           
-        self.control_surfaces.elevator.static_stability.coefficients.X         = ones_1col * 0           
-        self.control_surfaces.elevator.static_stability.coefficients.Y         = ones_1col * 0           
-        self.control_surfaces.elevator.static_stability.coefficients.Z         = ones_1col * 0         
-        self.control_surfaces.elevator.static_stability.coefficients.L         = ones_1col * 0         
-        self.control_surfaces.elevator.static_stability.coefficients.M         = ones_1col * 0         
-        self.control_surfaces.elevator.static_stability.coefficients.N         = ones_1col * 0           
-        self.control_surfaces.elevator.static_stability.coefficients.e         = ones_1col * 0
+        self.control_surfaces.elevator.static_stability.coefficients.lift      = zeros_row(1)        
+        self.control_surfaces.elevator.static_stability.coefficients.drag      = zeros_row(1)           
+        self.control_surfaces.elevator.static_stability.coefficients.X         = zeros_row(1)           
+        self.control_surfaces.elevator.static_stability.coefficients.Y         = zeros_row(1)           
+        self.control_surfaces.elevator.static_stability.coefficients.Z         = zeros_row(1)         
+        self.control_surfaces.elevator.static_stability.coefficients.L         = zeros_row(1)         
+        self.control_surfaces.elevator.static_stability.coefficients.M         = zeros_row(1)         
+        self.control_surfaces.elevator.static_stability.coefficients.N         = zeros_row(1)           
+        self.control_surfaces.elevator.static_stability.coefficients.e         = zeros_row(1)
         
         self.control_surfaces.rudder                                           = Conditions()
-        self.control_surfaces.rudder.deflection                                = ones_1col * 0 
+        self.control_surfaces.rudder.deflection                                = zeros_row(1) 
         self.control_surfaces.rudder.static_stability                          = Conditions()
         self.control_surfaces.rudder.static_stability.coefficients             = Conditions() 
-        self.control_surfaces.rudder.static_stability.coefficients.lift        = ones_1col * 0         
-        self.control_surfaces.rudder.static_stability.coefficients.drag        = ones_1col * 0          
-        self.control_surfaces.rudder.static_stability.coefficients.X           = ones_1col * 0          
-        self.control_surfaces.rudder.static_stability.coefficients.Y           = ones_1col * 0          
-        self.control_surfaces.rudder.static_stability.coefficients.Z           = ones_1col * 0         
-        self.control_surfaces.rudder.static_stability.coefficients.L           = ones_1col * 0         
-        self.control_surfaces.rudder.static_stability.coefficients.M           = ones_1col * 0         
-        self.control_surfaces.rudder.static_stability.coefficients.N           = ones_1col * 0           
-        self.control_surfaces.rudder.static_stability.coefficients.e           = ones_1col * 0
+        self.control_surfaces.rudder.static_stability.coefficients.lift        = zeros_row(1)         
+        self.control_surfaces.rudder.static_stability.coefficients.drag        = zeros_row(1)          
+        self.control_surfaces.rudder.static_stability.coefficients.X           = zeros_row(1)          
+        self.control_surfaces.rudder.static_stability.coefficients.Y           = zeros_row(1)          
+        self.control_surfaces.rudder.static_stability.coefficients.Z           = zeros_row(1)         
+        self.control_surfaces.rudder.static_stability.coefficients.L           = zeros_row(1)         
+        self.control_surfaces.rudder.static_stability.coefficients.M           = zeros_row(1)         
+        self.control_surfaces.rudder.static_stability.coefficients.N           = zeros_row(1)           
+        self.control_surfaces.rudder.static_stability.coefficients.e           = zeros_row(1)
         
         self.control_surfaces.flap                                             = Conditions()
-        self.control_surfaces.flap.deflection                                  = ones_1col * 0 
+        self.control_surfaces.flap.deflection                                  = zeros_row(1) 
         self.control_surfaces.flap.static_stability                            = Conditions()
         self.control_surfaces.flap.static_stability.coefficients               = Conditions() 
-        self.control_surfaces.flap.static_stability.coefficients.lift          = ones_1col * 0        
-        self.control_surfaces.flap.static_stability.coefficients.drag          = ones_1col * 0           
-        self.control_surfaces.flap.static_stability.coefficients.X             = ones_1col * 0           
-        self.control_surfaces.flap.static_stability.coefficients.Y             = ones_1col * 0           
-        self.control_surfaces.flap.static_stability.coefficients.Z             = ones_1col * 0         
-        self.control_surfaces.flap.static_stability.coefficients.L             = ones_1col * 0         
-        self.control_surfaces.flap.static_stability.coefficients.M             = ones_1col * 0         
-        self.control_surfaces.flap.static_stability.coefficients.N             = ones_1col * 0           
-        self.control_surfaces.flap.static_stability.coefficients.e             = ones_1col * 0
+        self.control_surfaces.flap.static_stability.coefficients.lift          = zeros_row(1)        
+        self.control_surfaces.flap.static_stability.coefficients.drag          = zeros_row(1)           
+        self.control_surfaces.flap.static_stability.coefficients.X             = zeros_row(1)           
+        self.control_surfaces.flap.static_stability.coefficients.Y             = zeros_row(1)           
+        self.control_surfaces.flap.static_stability.coefficients.Z             = zeros_row(1)         
+        self.control_surfaces.flap.static_stability.coefficients.L             = zeros_row(1)         
+        self.control_surfaces.flap.static_stability.coefficients.M             = zeros_row(1)         
+        self.control_surfaces.flap.static_stability.coefficients.N             = zeros_row(1)           
+        self.control_surfaces.flap.static_stability.coefficients.e             = zeros_row(1)
         
         self.control_surfaces.slat                                             = Conditions()
-        self.control_surfaces.slat.deflection                                  = ones_1col * 0 
+        self.control_surfaces.slat.deflection                                  = zeros_row(1) 
         self.control_surfaces.slat.static_stability                            = Conditions()
         self.control_surfaces.slat.static_stability.coefficients               = Conditions() 
-        self.control_surfaces.slat.static_stability.coefficients.lift          = ones_1col * 0         
-        self.control_surfaces.slat.static_stability.coefficients.drag          = ones_1col * 0          
-        self.control_surfaces.slat.static_stability.coefficients.X             = ones_1col * 0          
-        self.control_surfaces.slat.static_stability.coefficients.Y             = ones_1col * 0          
-        self.control_surfaces.slat.static_stability.coefficients.Z             = ones_1col * 0         
-        self.control_surfaces.slat.static_stability.coefficients.L             = ones_1col * 0         
-        self.control_surfaces.slat.static_stability.coefficients.M             = ones_1col * 0         
-        self.control_surfaces.slat.static_stability.coefficients.N             = ones_1col * 0           
-        self.control_surfaces.slat.static_stability.coefficients.e             = ones_1col * 0
+        self.control_surfaces.slat.static_stability.coefficients.lift          = zeros_row(1)         
+        self.control_surfaces.slat.static_stability.coefficients.drag          = zeros_row(1)          
+        self.control_surfaces.slat.static_stability.coefficients.X             = zeros_row(1)          
+        self.control_surfaces.slat.static_stability.coefficients.Y             = zeros_row(1)          
+        self.control_surfaces.slat.static_stability.coefficients.Z             = zeros_row(1)         
+        self.control_surfaces.slat.static_stability.coefficients.L             = zeros_row(1)         
+        self.control_surfaces.slat.static_stability.coefficients.M             = zeros_row(1)         
+        self.control_surfaces.slat.static_stability.coefficients.N             = zeros_row(1)           
+        self.control_surfaces.slat.static_stability.coefficients.e             = zeros_row(1)
 
         # ----------------------------------------------------------------------------------------------------------------------
         # Stability 
         # ----------------------------------------------------------------------------------------------------------------------  
-        self.stability                                                         = Conditions()
         self.static_stability                                                  = Conditions()
  
         self.static_stability.forces                                           = Conditions()
-        self.static_stability.forces.lift                                      = ones_1col * 0
-        self.static_stability.forces.drag                                      = ones_1col * 0
-        self.static_stability.forces.X                                         = ones_1col * 0
-        self.static_stability.forces.Y                                         = ones_1col * 0
-        self.static_stability.forces.Z                                         = ones_1col * 0
+        self.static_stability.forces.lift                                      = zeros_row(1)
+        self.static_stability.forces.drag                                      = zeros_row(1)
+        self.static_stability.forces.X                                         = zeros_row(1)
+        self.static_stability.forces.Y                                         = zeros_row(1)
+        self.static_stability.forces.Z                                         = zeros_row(1)
                                                                                
         self.static_stability.moments                                          = Conditions()
-        self.static_stability.moments.L                                        = ones_1col * 0
-        self.static_stability.moments.M                                        = ones_1col * 0
-        self.static_stability.moments.N                                        = ones_1col * 0
+        self.static_stability.moments.L                                        = zeros_row(1)
+        self.static_stability.moments.M                                        = zeros_row(1)
+        self.static_stability.moments.N                                        = zeros_row(1)
                                                                                
-        self.static_stability.static_margin                                    = ones_1col * 0
-        self.static_stability.neutral_point                                    = ones_1col * 0
-        self.static_stability.spiral_criteria                                  = ones_1col * 0 
-        self.static_stability.pitch_rate                                       = ones_1col * 0
-        self.static_stability.roll_rate                                        = ones_1col * 0
-        self.static_stability.yaw_rate                                         = ones_1col * 0 
+        self.static_stability.static_margin                                    = zeros_row(1)
+        self.static_stability.neutral_point                                    = zeros_row(1)
+        self.static_stability.spiral_criteria                                  = zeros_row(1) 
+        self.static_stability.pitch_rate                                       = zeros_row(1)
+        self.static_stability.roll_rate                                        = zeros_row(1)
+        self.static_stability.yaw_rate                                         = zeros_row(1) 
                                                                                
         self.static_stability.coefficients                                     = Conditions()
-        self.static_stability.coefficients.lift                                = ones_1col * 0
-        self.static_stability.coefficients.drag                                = ones_1col * 0
-        self.static_stability.coefficients.X                                   = ones_1col * 0
-        self.static_stability.coefficients.Y                                   = ones_1col * 0
-        self.static_stability.coefficients.Z                                   = ones_1col * 0
-        self.static_stability.coefficients.L                                   = ones_1col * 0
-        self.static_stability.coefficients.M                                   = ones_1col * 0
-        self.static_stability.coefficients.N                                   = ones_1col * 0 
-        self.static_stability.coefficients.roll                                = ones_1col * 0
-        self.static_stability.coefficients.pitch                               = ones_1col * 0
-        self.static_stability.coefficients.yaw                                 = ones_1col * 0  
+        self.static_stability.coefficients.lift                                = zeros_row(1)
+        self.static_stability.coefficients.drag                                = zeros_row(1)
+        self.static_stability.coefficients.X                                   = zeros_row(1)
+        self.static_stability.coefficients.Y                                   = zeros_row(1)
+        self.static_stability.coefficients.Z                                   = zeros_row(1)
+        self.static_stability.coefficients.L                                   = zeros_row(1)
+        self.static_stability.coefficients.M                                   = zeros_row(1)
+        self.static_stability.coefficients.N                                   = zeros_row(1) 
+        self.static_stability.coefficients.roll                                = zeros_row(1)
+        self.static_stability.coefficients.pitch                               = zeros_row(1)
+        self.static_stability.coefficients.yaw                                 = zeros_row(1)  
                                                                                
         self.static_stability.derivatives                                      = Conditions()
                                                                                
         # stability axis                                                       
-        self.static_stability.derivatives.Clift_alpha                          = ones_1col * 0
-        self.static_stability.derivatives.Clift_beta                           = ones_1col * 0
-        self.static_stability.derivatives.Clift_delta_a                        = ones_1col * 0
-        self.static_stability.derivatives.Clift_delta_e                        = ones_1col * 0
-        self.static_stability.derivatives.Clift_delta_r                        = ones_1col * 0
-        self.static_stability.derivatives.Clift_delta_f                        = ones_1col * 0
-        self.static_stability.derivatives.Clift_delta_s                        = ones_1col * 0
-        self.static_stability.derivatives.Cdrag_alpha                          = ones_1col * 0
-        self.static_stability.derivatives.Cdrag_beta                           = ones_1col * 0
-        self.static_stability.derivatives.Cdrag_delta_a                        = ones_1col * 0
-        self.static_stability.derivatives.Cdrag_delta_e                        = ones_1col * 0
-        self.static_stability.derivatives.Cdrag_delta_r                        = ones_1col * 0
-        self.static_stability.derivatives.Cdrag_delta_f                        = ones_1col * 0
-        self.static_stability.derivatives.Cdrag_delta_s                        = ones_1col * 0
-        self.static_stability.derivatives.CX_alpha                             = ones_1col * 0
-        self.static_stability.derivatives.CX_beta                              = ones_1col * 0
-        self.static_stability.derivatives.CX_delta_a                           = ones_1col * 0
-        self.static_stability.derivatives.CX_delta_e                           = ones_1col * 0
-        self.static_stability.derivatives.CX_delta_r                           = ones_1col * 0
-        self.static_stability.derivatives.CX_delta_f                           = ones_1col * 0
-        self.static_stability.derivatives.CX_delta_s                           = ones_1col * 0
-        self.static_stability.derivatives.CY_alpha                             = ones_1col * 0
-        self.static_stability.derivatives.CY_beta                              = ones_1col * 0
-        self.static_stability.derivatives.CY_delta_a                           = ones_1col * 0
-        self.static_stability.derivatives.CY_delta_e                           = ones_1col * 0
-        self.static_stability.derivatives.CY_delta_r                           = ones_1col * 0
-        self.static_stability.derivatives.CY_delta_f                           = ones_1col * 0
-        self.static_stability.derivatives.CY_delta_s                           = ones_1col * 0
-        self.static_stability.derivatives.CZ_alpha                             = ones_1col * 0
-        self.static_stability.derivatives.CZ_beta                              = ones_1col * 0
-        self.static_stability.derivatives.CZ_delta_a                           = ones_1col * 0
-        self.static_stability.derivatives.CZ_delta_e                           = ones_1col * 0
-        self.static_stability.derivatives.CZ_delta_r                           = ones_1col * 0
-        self.static_stability.derivatives.CZ_delta_f                           = ones_1col * 0
-        self.static_stability.derivatives.CZ_delta_s                           = ones_1col * 0
-        self.static_stability.derivatives.CL_alpha                             = ones_1col * 0
-        self.static_stability.derivatives.CL_beta                              = ones_1col * 0
-        self.static_stability.derivatives.CL_delta_a                           = ones_1col * 0
-        self.static_stability.derivatives.CL_delta_e                           = ones_1col * 0
-        self.static_stability.derivatives.CL_delta_r                           = ones_1col * 0
-        self.static_stability.derivatives.CL_delta_f                           = ones_1col * 0
-        self.static_stability.derivatives.CL_delta_s                           = ones_1col * 0
-        self.static_stability.derivatives.CM_alpha                             = ones_1col * 0
-        self.static_stability.derivatives.CM_beta                              = ones_1col * 0
-        self.static_stability.derivatives.CM_delta_a                           = ones_1col * 0
-        self.static_stability.derivatives.CM_delta_e                           = ones_1col * 0
-        self.static_stability.derivatives.CM_delta_r                           = ones_1col * 0
-        self.static_stability.derivatives.CM_delta_f                           = ones_1col * 0
-        self.static_stability.derivatives.CM_delta_s                           = ones_1col * 0
-        self.static_stability.derivatives.CN_alpha                             = ones_1col * 0
-        self.static_stability.derivatives.CN_beta                              = ones_1col * 0
-        self.static_stability.derivatives.CN_delta_a                           = ones_1col * 0
-        self.static_stability.derivatives.CN_delta_e                           = ones_1col * 0
-        self.static_stability.derivatives.CN_delta_r                           = ones_1col * 0
-        self.static_stability.derivatives.CN_delta_f                           = ones_1col * 0
-        self.static_stability.derivatives.CN_delta_s                           = ones_1col * 0
+        self.static_stability.derivatives.Clift_alpha                          = zeros_row(1)
+        self.static_stability.derivatives.Clift_beta                           = zeros_row(1)
+        self.static_stability.derivatives.Clift_delta_a                        = zeros_row(1)
+        self.static_stability.derivatives.Clift_delta_e                        = zeros_row(1)
+        self.static_stability.derivatives.Clift_delta_r                        = zeros_row(1)
+        self.static_stability.derivatives.Clift_delta_f                        = zeros_row(1)
+        self.static_stability.derivatives.Clift_delta_s                        = zeros_row(1)
+        self.static_stability.derivatives.Cdrag_alpha                          = zeros_row(1)
+        self.static_stability.derivatives.Cdrag_beta                           = zeros_row(1)
+        self.static_stability.derivatives.Cdrag_delta_a                        = zeros_row(1)
+        self.static_stability.derivatives.Cdrag_delta_e                        = zeros_row(1)
+        self.static_stability.derivatives.Cdrag_delta_r                        = zeros_row(1)
+        self.static_stability.derivatives.Cdrag_delta_f                        = zeros_row(1)
+        self.static_stability.derivatives.Cdrag_delta_s                        = zeros_row(1)
+        self.static_stability.derivatives.CX_alpha                             = zeros_row(1)
+        self.static_stability.derivatives.CX_beta                              = zeros_row(1)
+        self.static_stability.derivatives.CX_delta_a                           = zeros_row(1)
+        self.static_stability.derivatives.CX_delta_e                           = zeros_row(1)
+        self.static_stability.derivatives.CX_delta_r                           = zeros_row(1)
+        self.static_stability.derivatives.CX_delta_f                           = zeros_row(1)
+        self.static_stability.derivatives.CX_delta_s                           = zeros_row(1)
+        self.static_stability.derivatives.CY_alpha                             = zeros_row(1)
+        self.static_stability.derivatives.CY_beta                              = zeros_row(1)
+        self.static_stability.derivatives.CY_delta_a                           = zeros_row(1)
+        self.static_stability.derivatives.CY_delta_e                           = zeros_row(1)
+        self.static_stability.derivatives.CY_delta_r                           = zeros_row(1)
+        self.static_stability.derivatives.CY_delta_f                           = zeros_row(1)
+        self.static_stability.derivatives.CY_delta_s                           = zeros_row(1)
+        self.static_stability.derivatives.CZ_alpha                             = zeros_row(1)
+        self.static_stability.derivatives.CZ_beta                              = zeros_row(1)
+        self.static_stability.derivatives.CZ_delta_a                           = zeros_row(1)
+        self.static_stability.derivatives.CZ_delta_e                           = zeros_row(1)
+        self.static_stability.derivatives.CZ_delta_r                           = zeros_row(1)
+        self.static_stability.derivatives.CZ_delta_f                           = zeros_row(1)
+        self.static_stability.derivatives.CZ_delta_s                           = zeros_row(1)
+        self.static_stability.derivatives.CL_alpha                             = zeros_row(1)
+        self.static_stability.derivatives.CL_beta                              = zeros_row(1)
+        self.static_stability.derivatives.CL_delta_a                           = zeros_row(1)
+        self.static_stability.derivatives.CL_delta_e                           = zeros_row(1)
+        self.static_stability.derivatives.CL_delta_r                           = zeros_row(1)
+        self.static_stability.derivatives.CL_delta_f                           = zeros_row(1)
+        self.static_stability.derivatives.CL_delta_s                           = zeros_row(1)
+        self.static_stability.derivatives.CM_alpha                             = zeros_row(1)
+        self.static_stability.derivatives.CM_beta                              = zeros_row(1)
+        self.static_stability.derivatives.CM_delta_a                           = zeros_row(1)
+        self.static_stability.derivatives.CM_delta_e                           = zeros_row(1)
+        self.static_stability.derivatives.CM_delta_r                           = zeros_row(1)
+        self.static_stability.derivatives.CM_delta_f                           = zeros_row(1)
+        self.static_stability.derivatives.CM_delta_s                           = zeros_row(1)
+        self.static_stability.derivatives.CN_alpha                             = zeros_row(1)
+        self.static_stability.derivatives.CN_beta                              = zeros_row(1)
+        self.static_stability.derivatives.CN_delta_a                           = zeros_row(1)
+        self.static_stability.derivatives.CN_delta_e                           = zeros_row(1)
+        self.static_stability.derivatives.CN_delta_r                           = zeros_row(1)
+        self.static_stability.derivatives.CN_delta_f                           = zeros_row(1)
+        self.static_stability.derivatives.CN_delta_s                           = zeros_row(1)
         
         # body axis derivatives
-        self.static_stability.derivatives.Clift_u                              = ones_1col * 0
-        self.static_stability.derivatives.Clift_v                              = ones_1col * 0
-        self.static_stability.derivatives.Clift_w                              = ones_1col * 0 
-        self.static_stability.derivatives.Cdrag_u                              = ones_1col * 0
-        self.static_stability.derivatives.Cdrag_v                              = ones_1col * 0
-        self.static_stability.derivatives.Cdrag_w                              = ones_1col * 0         
-        self.static_stability.derivatives.CX_u                                 = ones_1col * 0
-        self.static_stability.derivatives.CX_v                                 = ones_1col * 0
-        self.static_stability.derivatives.CX_w                                 = ones_1col * 0
-        self.static_stability.derivatives.CY_u                                 = ones_1col * 0
-        self.static_stability.derivatives.CY_v                                 = ones_1col * 0
-        self.static_stability.derivatives.CY_w                                 = ones_1col * 0
-        self.static_stability.derivatives.CZ_u                                 = ones_1col * 0
-        self.static_stability.derivatives.CZ_v                                 = ones_1col * 0
-        self.static_stability.derivatives.CZ_w                                 = ones_1col * 0
-        self.static_stability.derivatives.CL_u                                 = ones_1col * 0
-        self.static_stability.derivatives.CL_v                                 = ones_1col * 0
-        self.static_stability.derivatives.CL_w                                 = ones_1col * 0
-        self.static_stability.derivatives.CM_u                                 = ones_1col * 0
-        self.static_stability.derivatives.CM_v                                 = ones_1col * 0
-        self.static_stability.derivatives.CM_w                                 = ones_1col * 0
-        self.static_stability.derivatives.CN_u                                 = ones_1col * 0
-        self.static_stability.derivatives.CN_v                                 = ones_1col * 0
-        self.static_stability.derivatives.CN_w                                 = ones_1col * 0 
-        self.static_stability.derivatives.CZ_alpha_dot                         = ones_1col * 0
-        self.static_stability.derivatives.CM_alpha_dot                         = ones_1col * 0 
-        self.static_stability.derivatives.Clift_p                              = ones_1col * 0
-        self.static_stability.derivatives.Clift_q                              = ones_1col * 0
-        self.static_stability.derivatives.Clift_r                              = ones_1col * 0
-        self.static_stability.derivatives.Cdrag_p                              = ones_1col * 0
-        self.static_stability.derivatives.Cdrag_q                              = ones_1col * 0
-        self.static_stability.derivatives.Cdrag_r                              = ones_1col * 0         
-        self.static_stability.derivatives.CX_p                                 = ones_1col * 0
-        self.static_stability.derivatives.CX_q                                 = ones_1col * 0
-        self.static_stability.derivatives.CX_r                                 = ones_1col * 0
-        self.static_stability.derivatives.CY_p                                 = ones_1col * 0
-        self.static_stability.derivatives.CY_q                                 = ones_1col * 0
-        self.static_stability.derivatives.CY_r                                 = ones_1col * 0
-        self.static_stability.derivatives.CZ_p                                 = ones_1col * 0
-        self.static_stability.derivatives.CZ_q                                 = ones_1col * 0
-        self.static_stability.derivatives.CZ_r                                 = ones_1col * 0
-        self.static_stability.derivatives.CL_p                                 = ones_1col * 0
-        self.static_stability.derivatives.CL_q                                 = ones_1col * 0
-        self.static_stability.derivatives.CL_r                                 = ones_1col * 0
-        self.static_stability.derivatives.CM_p                                 = ones_1col * 0
-        self.static_stability.derivatives.CM_q                                 = ones_1col * 0
-        self.static_stability.derivatives.CM_r                                 = ones_1col * 0
-        self.static_stability.derivatives.CN_p                                 = ones_1col * 0
-        self.static_stability.derivatives.CN_q                                 = ones_1col * 0
-        self.static_stability.derivatives.CN_r                                 = ones_1col * 0 
+        self.static_stability.derivatives.Clift_u                              = zeros_row(1)
+        self.static_stability.derivatives.Clift_v                              = zeros_row(1)
+        self.static_stability.derivatives.Clift_w                              = zeros_row(1) 
+        self.static_stability.derivatives.Cdrag_u                              = zeros_row(1)
+        self.static_stability.derivatives.Cdrag_v                              = zeros_row(1)
+        self.static_stability.derivatives.Cdrag_w                              = zeros_row(1)         
+        self.static_stability.derivatives.CX_u                                 = zeros_row(1)
+        self.static_stability.derivatives.CX_v                                 = zeros_row(1)
+        self.static_stability.derivatives.CX_w                                 = zeros_row(1)
+        self.static_stability.derivatives.CY_u                                 = zeros_row(1)
+        self.static_stability.derivatives.CY_v                                 = zeros_row(1)
+        self.static_stability.derivatives.CY_w                                 = zeros_row(1)
+        self.static_stability.derivatives.CZ_u                                 = zeros_row(1)
+        self.static_stability.derivatives.CZ_v                                 = zeros_row(1)
+        self.static_stability.derivatives.CZ_w                                 = zeros_row(1)
+        self.static_stability.derivatives.CL_u                                 = zeros_row(1)
+        self.static_stability.derivatives.CL_v                                 = zeros_row(1)
+        self.static_stability.derivatives.CL_w                                 = zeros_row(1)
+        self.static_stability.derivatives.CM_u                                 = zeros_row(1)
+        self.static_stability.derivatives.CM_v                                 = zeros_row(1)
+        self.static_stability.derivatives.CM_w                                 = zeros_row(1)
+        self.static_stability.derivatives.CN_u                                 = zeros_row(1)
+        self.static_stability.derivatives.CN_v                                 = zeros_row(1)
+        self.static_stability.derivatives.CN_w                                 = zeros_row(1) 
+        self.static_stability.derivatives.CZ_alpha_dot                         = zeros_row(1)
+        self.static_stability.derivatives.CM_alpha_dot                         = zeros_row(1) 
+        self.static_stability.derivatives.Clift_p                              = zeros_row(1)
+        self.static_stability.derivatives.Clift_q                              = zeros_row(1)
+        self.static_stability.derivatives.Clift_r                              = zeros_row(1)
+        self.static_stability.derivatives.Cdrag_p                              = zeros_row(1)
+        self.static_stability.derivatives.Cdrag_q                              = zeros_row(1)
+        self.static_stability.derivatives.Cdrag_r                              = zeros_row(1)         
+        self.static_stability.derivatives.CX_p                                 = zeros_row(1)
+        self.static_stability.derivatives.CX_q                                 = zeros_row(1)
+        self.static_stability.derivatives.CX_r                                 = zeros_row(1)
+        self.static_stability.derivatives.CY_p                                 = zeros_row(1)
+        self.static_stability.derivatives.CY_q                                 = zeros_row(1)
+        self.static_stability.derivatives.CY_r                                 = zeros_row(1)
+        self.static_stability.derivatives.CZ_p                                 = zeros_row(1)
+        self.static_stability.derivatives.CZ_q                                 = zeros_row(1)
+        self.static_stability.derivatives.CZ_r                                 = zeros_row(1)
+        self.static_stability.derivatives.CL_p                                 = zeros_row(1)
+        self.static_stability.derivatives.CL_q                                 = zeros_row(1)
+        self.static_stability.derivatives.CL_r                                 = zeros_row(1)
+        self.static_stability.derivatives.CM_p                                 = zeros_row(1)
+        self.static_stability.derivatives.CM_q                                 = zeros_row(1)
+        self.static_stability.derivatives.CM_r                                 = zeros_row(1)
+        self.static_stability.derivatives.CN_p                                 = zeros_row(1)
+        self.static_stability.derivatives.CN_q                                 = zeros_row(1)
+        self.static_stability.derivatives.CN_r                                 = zeros_row(1) 
                                                                                
         # dynamic stability                                                    
         self.dynamic_stability                                                 = Conditions()
@@ -434,20 +432,20 @@ class Results(Conditions):
         # Energy
         # ---------------------------------------------------------------------------------------------------------------------- 
         self.energy                                           = Conditions()
-        self.energy.throttle                                  = ones_1col * 0  
+        self.energy.throttle                                  = zeros_row(1)  
         self.energy.thrust_breakdown                          = Conditions()
         self.energy.thrust_breakdown                          = Conditions()
-        self.energy.thrust_force_vector                       = ones_3col * 0
-        self.energy.thrust_moment_vector                      = ones_3col * 0
-        self.energy.power                                     = ones_1col * 0
-        self.energy.vehicle_mass_rate                         = ones_1col * 0
+        self.energy.thrust_force_vector                       = zeros_row(3)
+        self.energy.thrust_moment_vector                      = zeros_row(3)
+        self.energy.power                                     = zeros_row(1)
+        self.energy.vehicle_mass_rate                         = zeros_row(1)
         
         
         # ----------------------------------------------------------------------------------------------------------------------         
         # Weights 
         # ----------------------------------------------------------------------------------------------------------------------     
         self.weights                                          = Conditions() 
-        self.weights.total_mass                               = ones_1col * 0
-        self.weights.total_moment_of_inertia                  = ones_3col * 0 # 3 total I(I_xx, I_yy, I_zz)? or 9(including I_xz etc)?
+        self.weights.total_mass                               = zeros_row(1)
+        self.weights.total_moment_of_inertia                  = zeros_row(3) # 3 total I(I_xx, I_yy, I_zz)? or 9(including I_xz etc)?
         self.weights.weight_breakdown                         = Conditions()
-        self.weights.vehicle_mass_rate                        = ones_1col * 0
\ No newline at end of file
+        self.weights.vehicle_mass_rate                        = zeros_row(1)
\ No newline at end of file
@@ -7,7 +7,10 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------  
 # RCAIDE imports        
-from RCAIDE.Framework.Core import Container 
+from RCAIDE.Framework.Core import Container, Data 
+
+# python imports 
+from concurrent.futures import ProcessPoolExecutor
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Mission
@@ -47,4 +50,61 @@ class Missions(Container):
         self.append(mission)
         return        
     
-     
\ No newline at end of file
+    def evaluate_parallel(self,processes=None):
+        """Evaluates the independent missions in the container on a pool of worker processes.
+    
+            Assumptions:
+            Missions do not share mutable state once built. The evaluated missions are stored back in this container,
+            replacing the missions that were sent to the workers, and the same missions are returned.
+            On platforms that start workers with spawn (macOS and Windows) every worker imports the calling script,
+            scripts calling this method must therefore guard their entry point with if __name__ == '__main__':.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            processes  - number of worker processes, None uses one per core and 1 evaluates in this process [int]
+    
+            Outputs:
+            results    - evaluated missions, keyed by mission tag [Data()]
+    
+            Properties Used:
+            None
+        """
+        tags     = [tag for tag,mission in self.items() if hasattr(mission,'evaluate')]
+        missions = [self[tag] for tag in tags]
+        
+        if processes == 1 or len(missions) < 2:
+            evaluated = [evaluate_mission(mission) for mission in missions]
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                evaluated = list(executor.map(evaluate_mission,missions))
+        
+        results = Data()
+        for tag,result in zip(tags,evaluated):
+            self[tag]    = result
+            results[tag] = result
+        return results
+    
+# ----------------------------------------------------------------------------------------------------------------------
+#  evaluate_mission
+# ----------------------------------------------------------------------------------------------------------------------  
+def evaluate_mission(mission):
+    """Evaluates a single mission. Kept at module level so that it can be sent to worker processes.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        mission  [Sequential_Segments()]
+
+        Outputs:
+        results  [Sequential_Segments()]
+
+        Properties Used:
+        None
+    """
+    return mission.evaluate()
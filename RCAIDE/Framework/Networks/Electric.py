@@ -108,19 +108,25 @@ class Electric(Network):
             compute_payload_power_draw(payload,payload_conditions,conditions)
 
             # Bus Voltage 
-            bus_voltage = bus.voltage * state.ones_row(1)
+            bus_voltage    = bus.voltage * state.ones_row(1)
+            bus_conditions = state.conditions.energy[bus.tag]
+
+            # scalar bus factors, evaluated once per bus rather than once per control point
+            power_scale    = bus.power_split_ratio/bus.efficiency
+            inv_voltage    = 1./bus.voltage
 
             if conditions.energy.recharging:
-                avionics_power         = (avionics_conditions.power*bus.power_split_ratio)* state.ones_row(1)
-                payload_power          = (payload_conditions.power*bus.power_split_ratio)* state.ones_row(1)            
-                total_esc_power        = 0 * state.ones_row(1)
                 bus.charging_current   = bus.nominal_capacity * bus.charging_c_rate 
-                charging_power         = (bus.charging_current*bus_voltage*bus.power_split_ratio)
+
+                # net bus power evaluated over all control points in place: (P_avionics + P_payload - P_charging)*split/eta
+                bus_power                         = -bus.charging_current*bus_voltage
+                bus_power                        += avionics_conditions.power
+                bus_power                        += payload_conditions.power
+                bus_power                        *= power_scale
 
                 # append bus outputs to battery
-                bus_conditions                    = state.conditions.energy[bus.tag]
-                bus_conditions.power_draw         = ((avionics_power + payload_power + total_esc_power) - charging_power)/bus.efficiency
-                bus_conditions.current_draw       = -bus_conditions.power_draw/bus.voltage
+                bus_conditions.power_draw         = bus_power
+                bus_conditions.current_draw       = -bus_power*inv_voltage
 
             else:       
                 # compute energy consumption of each battery on bus 
@@ -145,16 +151,15 @@ class Electric(Network):
                             total_moment += M   
                             total_power  += P 
 
-                # compute power from each componemnt 
-                avionics_power  = (avionics_conditions.power*bus.power_split_ratio)* state.ones_row(1) 
-                payload_power   = (payload_conditions.power*bus.power_split_ratio)* state.ones_row(1)   
-                charging_power  = (state.conditions.energy[bus.tag].regenerative_power*bus_voltage*bus.power_split_ratio) 
-                total_esc_power = total_power*bus.power_split_ratio  
+                # net bus power evaluated over all control points in place: (P_avionics + P_payload + P_esc - P_regen)*split/eta
+                bus_power                         = total_power + avionics_conditions.power
+                bus_power                        += payload_conditions.power
+                bus_power                        -= bus_conditions.regenerative_power*bus_voltage
+                bus_power                        *= power_scale
 
                 # append bus outputs to battery 
-                bus_conditions                    = state.conditions.energy[bus.tag]
-                bus_conditions.power_draw        += ((avionics_power + payload_power + total_esc_power) - charging_power)/bus.efficiency
-                bus_conditions.current_draw       = bus_conditions.power_draw/bus_voltage
+                bus_conditions.power_draw        += bus_power
+                bus_conditions.current_draw       = bus_conditions.power_draw*inv_voltage
 
 
         time               = state.conditions.frames.inertial.time[:,0] 
@@ -11,6 +11,7 @@ import RCAIDE
 from RCAIDE.Framework.Core                                            import Units , Data
 from .Generic_Battery_Module                                          import Generic_Battery_Module   
 from RCAIDE.Library.Methods.Energy.Sources.Batteries.Lithium_Ion_NMC  import *
+from RCAIDE.Library.Methods.Energy.Sources.Batteries.Common           import build_discharge_performance_map
 # package imports 
 import numpy as np
 import os 
@@ -167,8 +168,7 @@ class Lithium_Ion_NMC(Generic_Battery_Module):
         self.cell.axial_thermal_conductivity  = 32.2                                                                             # [J/kgK] # estimated
     
                                               
-        battery_raw_data                      = load_battery_results()                                                   
-        self.cell.discharge_performance_map   = create_discharge_performance_map(battery_raw_data)  
+        self.cell.discharge_performance_map   = build_discharge_performance_map(load_battery_results,create_discharge_performance_map)
 
         return  
     
@@ -14,4 +14,5 @@ from .find_mass_gain_rate                     import find_mass_gain_rate
 from .find_total_mass_gain                    import find_total_mass_gain
 from .size_module_from_mass                   import size_module_from_mass
 from .size_module_from_energy_and_power       import size_module_from_energy_and_power
-from .compute_module_properties               import compute_module_properties 
\ No newline at end of file
+from .compute_module_properties               import compute_module_properties 
+from .build_discharge_performance_map         import build_discharge_performance_map
\ No newline at end of file
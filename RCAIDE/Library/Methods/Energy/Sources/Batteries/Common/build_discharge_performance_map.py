@@ -0,0 +1,36 @@
+# RCAIDE/Methods/Energy/Sources/Battery/Common/build_discharge_performance_map.py
+# 
+# 
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  CACHE
+# ----------------------------------------------------------------------------------------------------------------------
+
+# raw cell data loaded so far, keyed by the loader that read it
+_raw_battery_data = {}
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  METHOD
+# ----------------------------------------------------------------------------------------------------------------------
+def build_discharge_performance_map(load_battery_results,create_discharge_performance_map):
+    """Builds a new discharge performance map for a battery module from cached raw cell data
+
+    Assumptions:
+    The raw cell data is only read by create_discharge_performance_map. It is loaded from
+    file once per session, while each module gets its own map so that changes to one
+    module's map do not leak into other modules
+
+    Source:
+    None
+
+    Inputs:
+    load_battery_results              - function returning the raw cell data        [function]
+    create_discharge_performance_map  - function building the map from the raw data [function]
+
+    Outputs:
+    discharge_performance_map         - discharge performance map of the cell       [Data() or interpolant]
+    """
+    if load_battery_results not in _raw_battery_data:
+        _raw_battery_data[load_battery_results] = load_battery_results()
+    return create_discharge_performance_map(_raw_battery_data[load_battery_results])
@@ -58,6 +58,7 @@ def compute_lfp_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
     battery_module_conditions = state.conditions.energy[bus.tag].battery_modules[battery_module.tag]  
    
     E_module_max       = battery_module.maximum_energy * battery_module_conditions.cell.capacity_fade_factor
+    inv_E_module_max   = 1./E_module_max
     
     V_oc_module        = battery_module_conditions.voltage_open_circuit
     V_oc_cell          = battery_module_conditions.cell.voltage_open_circuit   
@@ -99,12 +100,9 @@ def compute_lfp_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
     # ---------------------------------------------------------------------------------
     HAS = None  
     for coolant_line in coolant_lines:
-        for tag, item in  coolant_line.items():
-            if tag == 'battery_modules':
-                for sub_tag, sub_item in item.items():
-                    if sub_tag == battery_module.tag:
-                        for btms in  sub_item:
-                            HAS = btms    
+        if battery_module.tag in coolant_line.get('battery_modules',()):
+            for btms in coolant_line.battery_modules[battery_module.tag]:
+                HAS = btms    
 
 
     # ---------------------------------------------------------------------------------------------------
@@ -123,7 +121,7 @@ def compute_lfp_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
     # Determine temperature increase         
     sigma                 =  130  
     i_cell                = I_cell[t_idx]/electrode_area # current intensity (A/m²)
-    q_dot_entropy         = (4.6810 * SOC_cell[t_idx]**4 + (-8.3729) * SOC_cell[t_idx]**3 + 3.7197 * SOC_cell[t_idx]**2 + 0.4356 * SOC_cell[t_idx]+ (-0.3027)) # Obtained from curve fitting the dUdt curve  
+    q_dot_entropy         = np.polyval([4.6810, -8.3729, 3.7197, 0.4356, -0.3027],SOC_cell[t_idx]) # Obtained from curve fitting the dUdt curve  
     q_dot_joule           = (i_cell**2)/(sigma)          
     Q_heat_cell[t_idx]    = (q_dot_joule + q_dot_entropy)*As_cell 
     Q_heat_module[t_idx]  = Q_heat_cell[t_idx]*n_total  
@@ -153,10 +151,9 @@ def compute_lfp_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
             
         # Compute state of charge and depth of discarge of the battery_module
         E_module[t_idx+1]                                     = np.float32(E_module[t_idx] -P_module[t_idx]*delta_t[t_idx])
-        E_module[t_idx+1][E_module[t_idx+1] > E_module_max]   = np.float32(E_module_max)
-        SOC_cell[t_idx+1]                                     = E_module[t_idx+1]/E_module_max 
-        SOC_cell[t_idx+1][SOC_cell[t_idx+1]>1]                = 1.
-        SOC_cell[t_idx+1][SOC_cell[t_idx+1]<0]                = 0. 
+        np.minimum(E_module[t_idx+1],np.float32(E_module_max),out=E_module[t_idx+1])
+        SOC_cell[t_idx+1]                                     = E_module[t_idx+1]*inv_E_module_max 
+        np.clip(SOC_cell[t_idx+1],0.,1.,out=SOC_cell[t_idx+1])
         DOD_cell[t_idx+1]                                     = 1 - SOC_cell[t_idx+1]  
         SOC_module[t_idx+1]                                   = SOC_cell[t_idx+1]
     
@@ -213,20 +210,17 @@ def compute_lfp_cell_state(battery_module,battery_module_data,SOC,T,I):
 
     # Make sure things do not break by limiting current, temperature and current 
     capacity      = battery_module.cell.nominal_capacity
-    SOC[SOC < 0.]   = 0.  
-    SOC[SOC > 1.]   = 1.    
+    np.clip(SOC,0.,1.,out=SOC)  
     DOD             = 1 - SOC 
     discharge_capacity = DOD*capacity
     
 
     T              = T-273
     # Operating Limits of the cell
-    T[T<-10]       = -10 # model does not fit for below -10  degrees
-    T[T>60]        =  60 # model does not fit for above 60 degrees
+    np.clip(T,-10,60,out=T) # model does not fit for below -10 or above 60 degrees
 
     
-    I[I<0.0]      = 0.0
-    I[I>52.0]     = 52.0
+    np.clip(I,0.0,52.0,out=I)
     C_rate        = I/capacity
      
 
@@ -129,6 +129,7 @@ def compute_nmc_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
     battery_module_conditions = state.conditions.energy[bus.tag].battery_modules[battery_module.tag]  
    
     E_module_max       = battery_module.maximum_energy * battery_module_conditions.cell.capacity_fade_factor
+    inv_E_module_max   = 1./E_module_max
     
     V_oc_module        = battery_module_conditions.voltage_open_circuit
     V_oc_cell          = battery_module_conditions.cell.voltage_open_circuit   
@@ -172,12 +173,9 @@ def compute_nmc_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
     # ---------------------------------------------------------------------------------
     HAS = None  
     for coolant_line in coolant_lines:
-        for tag, item in  coolant_line.items():
-            if tag == 'battery_modules':
-                for sub_tag, sub_item in item.items():
-                    if sub_tag == battery_module.tag:
-                        for btms in  sub_item:
-                            HAS = btms    
+        if battery_module.tag in coolant_line.get('battery_modules',()):
+            for btms in coolant_line.battery_modules[battery_module.tag]:
+                HAS = btms    
 
 
     # ---------------------------------------------------------------------------------------------------
@@ -193,15 +191,15 @@ def compute_nmc_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
     # ---------------------------------------------------------------------------------
     # Compute battery_module cell temperature 
     # ---------------------------------------------------------------------------------
-    R_0_cell[t_idx]                     =  (0.01483*(SOC_cell[t_idx]**2) - 0.02518*SOC_cell[t_idx] + 0.1036) *battery_module_conditions.cell.resistance_growth_factor  
-    R_0_cell[t_idx][R_0_cell[t_idx]<0]  = 0. 
+    # internal resistance is evaluated, scaled by growth factor and clamped in the stored row 
+    np.multiply(np.polyval([0.01483, -0.02518, 0.1036],SOC_cell[t_idx]),battery_module_conditions.cell.resistance_growth_factor,out=R_0_cell[t_idx])  
+    np.maximum(R_0_cell[t_idx],0.,out=R_0_cell[t_idx]) 
 
     # Determine temperature increase         
     sigma                 = 139 # Electrical conductivity
     n                     = 1
     F                     = 96485 # C/mol Faraday constant    
-    delta_S               = -496.66*(SOC_cell[t_idx])**6 +  1729.4*(SOC_cell[t_idx])**5 + -2278 *(SOC_cell[t_idx])**4 +  1382.2 *(SOC_cell[t_idx])**3 + \
-                            -380.47*(SOC_cell[t_idx])**2 +  46.508*(SOC_cell[t_idx])  + -10.692  
+    delta_S               = np.polyval([-496.66, 1729.4, -2278, 1382.2, -380.47, 46.508, -10.692],SOC_cell[t_idx]) # Horner's scheme  
 
     i_cell                = I_cell[t_idx]/electrode_area # current intensity
     q_dot_entropy         = -(T_cell[t_idx])*delta_S*i_cell/(n*F)       
@@ -211,7 +209,8 @@ def compute_nmc_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
 
     V_ul_cell[t_idx]      = compute_nmc_cell_state(battery_module_data,SOC_cell[t_idx],T_cell[t_idx],abs(I_cell[t_idx])) 
 
-    V_oc_cell[t_idx]      = V_ul_cell[t_idx] + (abs(I_cell[t_idx]) * R_0_cell[t_idx])              
+    np.multiply(abs(I_cell[t_idx]),R_0_cell[t_idx],out=V_oc_cell[t_idx])              
+    V_oc_cell[t_idx]     += V_ul_cell[t_idx]
 
     # Effective Power flowing through battery_module 
     P_module[t_idx]       = P_bus[t_idx] /no_modules  - np.abs(Q_heat_module[t_idx]) 
@@ -239,10 +238,9 @@ def compute_nmc_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
             
         # Compute state of charge and depth of discarge of the battery_module
         E_module[t_idx+1]                                     = (E_module[t_idx]) -P_module[t_idx]*delta_t[t_idx]
-        E_module[t_idx+1][E_module[t_idx+1] > E_module_max]   = np.float32(E_module_max)
-        SOC_cell[t_idx+1]                                     = E_module[t_idx+1]/E_module_max 
-        SOC_cell[t_idx+1][SOC_cell[t_idx+1]>1]                = 1.
-        SOC_cell[t_idx+1][SOC_cell[t_idx+1]<0]                = 0. 
+        np.minimum(E_module[t_idx+1],np.float32(E_module_max),out=E_module[t_idx+1])
+        SOC_cell[t_idx+1]                                     = E_module[t_idx+1]*inv_E_module_max 
+        np.clip(SOC_cell[t_idx+1],0.,1.,out=SOC_cell[t_idx+1])
         DOD_cell[t_idx+1]                                     = 1 - SOC_cell[t_idx+1]  
         SOC_module[t_idx+1]                                   = SOC_cell[t_idx+1]
 
@@ -302,18 +300,15 @@ def compute_nmc_cell_state(battery_module_data,SOC,T,I):
     """ 
 
     # Make sure things do not break by limiting current, temperature and current 
-    SOC[SOC < 0.]   = 0.  
-    SOC[SOC > 1.]   = 1.    
+    np.clip(SOC,0.,1.,out=SOC)  
     DOD             = 1 - SOC 
     
-    T[np.isnan(T)] = 302.65
-    T[T<272.65]    = 272.65 # model does not fit for below 0  degrees
-    T[T>322.65]    = 322.65 # model does not fit for above 50 degrees
+    np.nan_to_num(T,copy=False,nan=302.65)
+    np.clip(T,272.65,322.65,out=T) # model does not fit for below 0 or above 50 degrees
      
-    I[I<0.0]       = 0.0
-    I[I>8.0]       = 8.0   
+    np.clip(I,0.0,8.0,out=I)   
      
-    pts            = np.hstack((np.hstack((I, T)),DOD  )) # amps, temp, SOC   
-    V_ul           = np.atleast_2d(battery_module_data.Voltage(pts)[:,1]).T  
+    pts            = np.hstack((I, T, DOD)) # amps, temp, SOC   
+    V_ul           = battery_module_data.Voltage(pts)[:,1:2]  
     
     return V_ul
\ No newline at end of file
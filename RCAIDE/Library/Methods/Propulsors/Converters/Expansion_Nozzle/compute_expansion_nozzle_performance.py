@@ -77,29 +77,25 @@ def compute_expansion_nozzle_performance(expansion_nozzle,nozzle_conditions,cond
     gamma          = working_fluid.compute_gamma(T_in,P_in) 
     Cp             = working_fluid.compute_cp(T_in,P_in)    
      
-    # Compute output stagnation quantities
-    Pt_out   = Pt_in*PR
-    Tt_out   = Tt_in*PR**((gamma-1)/(gamma)*etapold)
+    # Isentropic exponents shared by the relations below, evaluated once per call
+    gm1      = gamma-1.
+    k        = gm1/gamma
+     
+    # Compute output stagnation quantities, with a cap so pressure doesn't go negative
+    Pt_out   = np.maximum(Pt_in*PR,P0)
+    Tt_out   = Tt_in*PR**(k*etapold)
     ht_out   = Cp*Tt_out
     
-    # A cap so pressure doesn't go negative
-    Pt_out[Pt_out<P0] = P0[Pt_out<P0]
-    
     # Compute the output Mach number, static quantities and the output velocity
-    Mach          = np.sqrt((((Pt_out/P0)**((gamma-1)/gamma))-1)*2/(gamma-1)) 
-    
-    #initializing the Pout array
-    P_out         = np.ones_like(Mach)
-    
-    # Computing output pressure and Mach number for the case Mach <1.0
-    i_low         = Mach < 1.0
-    P_out[i_low]  = P0[i_low]
-    Mach[i_low]   = np.sqrt((((Pt_out[i_low]/P0[i_low])**((gamma[i_low]-1.)/gamma[i_low]))-1.)*2./(gamma[i_low]-1.))
+    Mach          = (Pt_out/P0)**k
+    Mach         -= 1.
+    Mach         *= 2./gm1
+    np.sqrt(Mach,out=Mach)
     
-    # Computing output pressure and Mach number for the case Mach >=1.0     
-    i_high        = Mach >=1.0   
-    Mach[i_high]  = Mach[i_high]/Mach[i_high]
-    P_out[i_high] = Pt_out[i_high]/(1.+(gamma[i_high]-1.)/2.*Mach[i_high]*Mach[i_high])**(gamma[i_high]/(gamma[i_high]-1.))
+    # Output pressure is ambient for Mach < 1.0, otherwise the nozzle is choked at Mach = 1.0
+    i_high        = Mach >= 1.0 
+    Mach          = np.where(i_high,1.0,Mach)
+    P_out         = np.where(i_high,Pt_out/(1.+gm1/2.)**(1./k),P0)
     
     # A cap to make sure Mach doesn't go to zero:
     if np.any(Mach<=0.0):
@@ -107,13 +103,15 @@ def compute_expansion_nozzle_performance(expansion_nozzle,nozzle_conditions,cond
         Mach[Mach<=0.0] = 0.001
     
     # Compute the output temperature,enthalpy,velocity and density
-    T_out         = Tt_out/(1+(gamma-1)/2*Mach*Mach)
+    T_out         = Tt_out/(1+gm1/2*Mach*Mach)
     h_out         = T_out * Cp
-    u_out         = np.sqrt(2*(ht_out-h_out))
+    u_out         = ht_out-h_out
+    u_out        *= 2.
+    np.sqrt(u_out,out=u_out)
     #rho_out       = P_out/(R*T_out)
     
     # Compute the freestream to nozzle area ratio  
-    area_ratio    = (fm_id(M0,gamma)/fm_id(Mach,gamma)*(1/(Pt_out/Pt0))*(np.sqrt(Tt_out/Tt0)))
+    area_ratio    = fm_id(M0,gamma)/fm_id(Mach,gamma)*(Pt0/Pt_out)*np.sqrt(Tt_out/Tt0)
     
     #pack computed quantities into outputs
     nozzle_conditions.outputs.area_ratio              = area_ratio
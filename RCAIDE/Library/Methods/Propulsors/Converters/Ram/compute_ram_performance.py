@@ -56,8 +56,9 @@ def compute_ram_performance(ram,ram_conditions,conditions):
     V0       = a*M0 
 
     # Compute the stagnation quantities from the input static quantities
-    stagnation_pressure    = P0*((1.+(gamma-1.)/2.*M0*M0 )**(gamma/(gamma-1.))) 
-    stagnation_temperature = T0*(1.+((gamma-1.)/2.*M0*M0))
+    temperature_ratio      = 1.+(gamma-1.)/2.*M0*M0
+    stagnation_pressure    = P0*(temperature_ratio**(gamma/(gamma-1.))) 
+    stagnation_temperature = T0*temperature_ratio
 
     # Store values into flight conditions data structure  
     conditions.freestream.isentropic_expansion_factor          = gamma
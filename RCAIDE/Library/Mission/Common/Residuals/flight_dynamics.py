@@ -55,17 +55,23 @@ def flight_dynamics(segment):
         segment.state.residuals.force_x[:,0] = FT[1:,0]/m[1:,0] - a[1:,0] 
         segment.state.residuals.final_velocity_error = (v[-1,0] - vf)
     else: 
-        if segment.flight_dynamics.force_x: 
-            segment.state.residuals.force_x[:,0] = FT[:,0]/m[:,0] - a[:,0]  
-        if segment.flight_dynamics.force_y: 
-            segment.state.residuals.force_y[:,0] = FT[:,1]/m[:,0] - a[:,1]    
-        if segment.flight_dynamics.force_z: 
-            segment.state.residuals.force_z[:,0] = FT[:,2]/m[:,0] - a[:,2]  
-        if  segment.flight_dynamics.moment_x:
-            segment.state.residuals.moment_x[:,0] = MT[:,0]/I[0,0] - ang_acc[:,0]   
-        if  segment.flight_dynamics.moment_y:
-            segment.state.residuals.moment_y[:,0] = MT[:,1]/I[1,1] - ang_acc[:,1]   
-        if  segment.flight_dynamics.moment_z:
-            segment.state.residuals.moment_z[:,0] = MT[:,2]/I[2,2] - ang_acc[:,2] 
+        # evaluate the force balance for all three axes at once, then pack the active degrees of freedom
+        dynamics  = segment.flight_dynamics
+        residuals = segment.state.residuals
+        if dynamics.force_x or dynamics.force_y or dynamics.force_z:
+            R_F = FT/m - a 
+            if dynamics.force_x: 
+                residuals.force_x[:,0] = R_F[:,0]  
+            if dynamics.force_y: 
+                residuals.force_y[:,0] = R_F[:,1]    
+            if dynamics.force_z: 
+                residuals.force_z[:,0] = R_F[:,2]  
+        # moments are only divided by the inertia of active axes, an unused axis may have zero inertia
+        if  dynamics.moment_x:
+            residuals.moment_x[:,0] = MT[:,0]/I[0,0] - ang_acc[:,0]   
+        if  dynamics.moment_y:
+            residuals.moment_y[:,0] = MT[:,1]/I[1,1] - ang_acc[:,1]   
+        if  dynamics.moment_z:
+            residuals.moment_z[:,0] = MT[:,2]/I[2,2] - ang_acc[:,2] 
      
     return
@@ -11,23 +11,23 @@ import RCAIDE
 from RCAIDE.Framework.Core  import Data 
 
 def pre_process(mission): 
-    for tag,segment in mission.segments.items():     
+    for segment in mission.segments.values():     
         segment.pre_process()
 
 def sequential_segments(mission):  
     
-    last_tag = None
-    for tag,segment in mission.segments.items(): 
-        if last_tag:
-            segment.state.initials = mission.segments[last_tag].state
-        last_tag = tag        
+    last_segment = None
+    for segment in mission.segments.values(): 
+        if last_segment is not None:
+            segment.state.initials = last_segment.state
+        last_segment = segment        
         
         segment.process.initialize.expand_state(segment) 
         segment.process.initialize.expand_state = RCAIDE.Library.Methods.skip        
         segment.evaluate()
         
 def update_segments(mission):   
-    for tag,segment in mission.segments.items():
+    for segment in mission.segments.values():
         segment.post_process() 
         
 def merge_segment_states(mission): 
@@ -43,9 +43,12 @@ def converge_root(segment):
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
     
+    # flatten the iterate process once per solve, each solver call then runs a fixed tuple of steps
+    iterate_steps = segment.process.iterate.flatten()
+    
     unknowns,infodict,ier,msg = root_finder( iterate,
                                          unknowns,
-                                         args = segment,
+                                         args = (segment,iterate_steps),
                                          xtol = segment.state.numerics.tolerance_solution,
                                          maxfev = segment.state.numerics.max_evaluations,
                                          epsfcn = segment.state.numerics.step_size,
@@ -65,7 +68,7 @@ def converge_root(segment):
 # ---------------------------------------------------------------------------------------------------------------------- 
 #  Helper Functions
 # ---------------------------------------------------------------------------------------------------------------------- 
-def iterate(unknowns, segment):
+def iterate(unknowns, segment, iterate_steps=None):
     
     """Runs one iteration of of all analyses for the mission.
 
@@ -78,6 +81,7 @@ def iterate(unknowns, segment):
     Inputs:
     state.unknowns                [Data]
     segment.process.iterate       [Data]
+    iterate_steps                 [tuple] (optional, flattened segment.process.iterate)
 
     Outputs:
     residuals                     [Unitless]
@@ -90,7 +94,11 @@ def iterate(unknowns, segment):
     else:
         segment.state.unknowns = unknowns
         
-    segment.process.iterate(segment)
+    if iterate_steps is None:
+        segment.process.iterate(segment)
+    else:
+        for step in iterate_steps:
+            step(segment)
     
     residuals = segment.state.residuals.pack_array()
         
@@ -0,0 +1,190 @@
+'''
+# parallel_missions_test.py
+#
+# Created: Oct 2026, RCAIDE Team
+
+'''
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+import RCAIDE
+from RCAIDE.Framework.Core import Units
+
+# python imports
+import numpy as np
+import sys
+import os
+
+# local imports
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Tiltwing_EVTOL         import vehicle_setup as  TW_vehicle_setup
+from Tiltwing_EVTOL         import configs_setup as  TW_configs_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    # make true only when resizing aircraft. should be left false for regression
+    update_regression_values = False
+
+    vehicle  = TW_vehicle_setup(update_regression_values)
+    configs  = TW_configs_setup(vehicle)
+    analyses = analyses_setup(configs)
+
+    # evaluate the same missions on two worker processes and sequentially in this process
+    parallel_missions   = missions_setup(analyses)
+    parallel_results    = parallel_missions.evaluate_parallel(processes=2)
+
+    sequential_missions = missions_setup(analyses)
+
+    for tag in parallel_results.keys():
+        sequential_results = sequential_missions[tag].evaluate()
+
+        # the evaluated missions are stored back in the container
+        assert(parallel_missions[tag] is parallel_results[tag])
+
+        # the parallel evaluation must reproduce the segment conditions, unused conditions are nan in both
+        for segment_tag,segment in sequential_results.segments.items():
+            sequential_conditions = segment.conditions.pack_array()
+            parallel_conditions   = parallel_results[tag].segments[segment_tag].conditions.pack_array()
+            assert(np.allclose(sequential_conditions,parallel_conditions,equal_nan=True))
+    return
+
+# ----------------------------------------------------------------------
+#   Define the Vehicle Analyses
+# ----------------------------------------------------------------------
+def analyses_setup(configs):
+
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+
+    # build a base analysis for each config
+    for tag,config in configs.items():
+        analysis = base_analysis(config)
+        analyses[tag] = analysis
+
+    return analyses
+
+def base_analysis(vehicle):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Analyses
+    # ------------------------------------------------------------------
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    # ------------------------------------------------------------------
+    #  Weights
+    weights         = RCAIDE.Framework.Analyses.Weights.Weights_EVTOL()
+    weights.vehicle = vehicle
+    analyses.append(weights)
+
+    # ------------------------------------------------------------------
+    #  Aerodynamics Analysis
+    aerodynamics          = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle = vehicle
+    aerodynamics.settings.drag_coefficient_increment = 0.0000
+    analyses.append(aerodynamics)
+
+    # ------------------------------------------------------------------
+    #  Energy
+    energy          = RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    # ------------------------------------------------------------------
+    #  Planet Analysis
+    planet = RCAIDE.Framework.Analyses.Planets.Earth()
+    analyses.append(planet)
+
+    # ------------------------------------------------------------------
+    #  Atmosphere Analysis
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    # done!
+    return analyses
+
+# ----------------------------------------------------------------------
+#   Define the Missions
+# ----------------------------------------------------------------------
+def hover_mission_setup(analyses):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+    mission     = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag = 'hover_mission'
+
+    # unpack Segments module
+    Segments = RCAIDE.Framework.Mission.Segments
+    base_segment = Segments.Segment()
+    base_segment.state.numerics.number_of_control_points    = 3
+
+    # ------------------------------------------------------------------
+    #   Hover Segment
+    # ------------------------------------------------------------------
+    segment                                                          = Segments.Vertical_Flight.Hover(base_segment)
+    segment.tag                                                      = "Hover"
+    segment.analyses.extend(analyses.vertical_climb)
+    segment.altitude                                                 = 40.  * Units.ft
+    segment.initial_battery_state_of_charge                          = 1.0
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_z                                  = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['lift_rotor_propulsor_1','lift_rotor_propulsor_2','lift_rotor_propulsor_3','lift_rotor_propulsor_4',
+                                                            'lift_rotor_propulsor_5','lift_rotor_propulsor_6','lift_rotor_propulsor_7','lift_rotor_propulsor_8']]
+
+    mission.append_segment(segment)
+
+    return mission
+
+def climb_mission_setup(analyses):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+    mission     = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag = 'climb_mission'
+
+    # unpack Segments module
+    Segments = RCAIDE.Framework.Mission.Segments
+    base_segment = Segments.Segment()
+    base_segment.state.numerics.number_of_control_points    = 3
+
+    # ------------------------------------------------------------------
+    #   Vertical Climb Segment
+    # ------------------------------------------------------------------
+    segment                                                          = Segments.Vertical_Flight.Climb(base_segment)
+    segment.tag                                                      = "Vertical_Climb"
+    segment.analyses.extend(analyses.vertical_climb)
+    segment.altitude_start                                           = 0.   * Units.ft
+    segment.altitude_end                                             = 60.  * Units.ft
+    segment.initial_battery_state_of_charge                          = 1.0
+    segment.climb_rate                                               = 100. * Units['ft/min']
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_z                                  = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['lift_rotor_propulsor_1','lift_rotor_propulsor_2','lift_rotor_propulsor_3','lift_rotor_propulsor_4',
+                                                            'lift_rotor_propulsor_5','lift_rotor_propulsor_6','lift_rotor_propulsor_7','lift_rotor_propulsor_8']]
+
+    mission.append_segment(segment)
+
+    return mission
+
+def missions_setup(analyses):
+
+    missions = RCAIDE.Framework.Mission.Missions()
+    missions.append(hover_mission_setup(analyses))
+    missions.append(climb_mission_setup(analyses))
+
+    return missions
+
+
+if __name__ == '__main__':
+    main()
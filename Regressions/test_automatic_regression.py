@@ -34,6 +34,7 @@ modules = [
     'Tests/geometry/fuselage_planform_compute.py',  
     'Tests/future_capability_coverage/coverage_test.py',    
     'Tests/mission_segments/transition_segment_test.py', 
+    'Tests/mission_segments/parallel_missions_test.py',
     'Tests/network_electric/electric_btms_test.py', 
     'Tests/network_ducted_fan/electric_ducted_fan_network_test.py',
     'Tests/network_turbofan/turbofan_network_test.py',